@@ -0,0 +1,57 @@
+# coding: utf-8
+"""
+Run the benchmark suite::
+
+    $ python -m benchmarks                      # run and compare to the baseline
+    $ python -m benchmarks -k get --output run.json
+    $ python -m benchmarks --save-baseline      # store this run as the baseline
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import os
+import sys
+
+from .runner import compare, dump, load, run
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('-k', dest='keyword', help='only run benchmarks containing KEYWORD')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='write the results as JSON to OUTPUT')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline JSON to compare with')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown ratio reported as a regression (default: 1.25)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store the results as the new baseline')
+    return parser.parse_args(argv)
+
+
+def report(results, baseline_path, threshold):
+    rows, regressions = compare(results, load(baseline_path), threshold)
+    print('\n{:<48} {:>12} {:>12} {:>8}'.format('vs baseline', 'baseline', 'current', 'ratio'))
+    for name, base, value, ratio in rows:
+        flag = ' <--' if name in regressions else ''
+        print('{:<48} {:>12.1f} {:>12.1f} {:>7.2f}x{}'.format(name, base, value, ratio, flag))
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    results = run(keyword=args.keyword, repeat=args.repeat)
+
+    if args.output:
+        dump(results, args.output)
+    if args.save_baseline:
+        dump(results, args.baseline)
+        return 0
+    if os.path.exists(args.baseline):
+        return report(results, args.baseline, args.threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+# coding: utf-8
+"""
+Compare the cached ``choices()``/``values()``/``options()`` against the
+per-call list building they replaced.
+
+Usage::
+
+    $ python -m benchmarks.bench_choices
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import timeit
+import tracemalloc
+
+from choicesenum import ChoicesEnum
+from choicesenum.patches import patch_list_choices
+
+Big = ChoicesEnum('Big', [('ITEM_{}'.format(i), i) for i in range(50)])
+
+LEGACY = {
+    'choices': lambda cls: [(x, x.display) for x in cls],
+    'values': lambda cls: [x.value for x in cls],
+    'options': lambda cls: list(cls),
+}
+
+NUMBER = 10000
+
+
+def allocated(func, number=NUMBER):
+    "Total bytes allocated by `number` calls of `func`, freed or not."
+    results = []
+    tracemalloc.start()
+    try:
+        for _ in range(number):
+            results.append(func())
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(label, func):
+    seconds = timeit.timeit(func, number=NUMBER)
+    print('{:<28} {:>10.3f} us/call {:>12} bytes'.format(
+        label, seconds / NUMBER * 1e6, allocated(func)))
+
+
+def main():
+    for name, legacy in sorted(LEGACY.items()):
+        measure('{} (legacy lists)'.format(name), lambda: legacy(Big))
+        measure('{} (cached)'.format(name), getattr(Big, name))
+        patch_list_choices()
+        measure('{} (list compat)'.format(name), getattr(Big, name))
+        patch_list_choices(False)
+
+
+if __name__ == '__main__':
+    main()
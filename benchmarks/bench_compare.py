@@ -0,0 +1,80 @@
+# coding: utf-8
+"""
+Compare ``ChoicesEnum`` hashing, comparisons and ``is_<name>`` predicates
+against the previous implementation, which went through the ``value``
+property on every call.
+
+Usage::
+
+    $ python -m benchmarks.bench_compare
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import random
+import timeit
+
+from choicesenum import ChoicesEnum
+
+MEMBERS = [('ITEM_{}'.format(i), i) for i in range(50)]
+
+Fast = ChoicesEnum('Fast', MEMBERS)
+
+
+class Legacy(ChoicesEnum):
+    "Same as `Fast`, with the previous hash and comparisons"
+    locals().update(MEMBERS)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __lt__(self, other):
+        return self.value < self._get_value(other)
+
+    def __eq__(self, other):
+        return self.value == self._get_value(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+
+# the previous `is_<name>` predicates, one property per item
+for _name, _member in Legacy._member_map_.items():
+    setattr(Legacy, 'is_{}'.format(_name.lower()),
+            property(lambda self, member=_member: self == member))
+
+
+NUMBER = 200
+
+
+def scenarios(enum):
+    members = list(enum)
+    shuffled = random.Random(42).sample(members, len(members))
+    by_member = dict.fromkeys(members)
+    first, last = members[0], members[-1]
+    return [
+        ('hash', lambda: [hash(x) for x in shuffled]),
+        ('dict lookup', lambda: [by_member[x] for x in shuffled]),
+        ('== same item', lambda: [x == x for x in shuffled]),
+        ('== other item', lambda: [x == first for x in shuffled]),
+        ('== raw value', lambda: [x == 10 for x in shuffled]),
+        ('!= raw value', lambda: [x != 10 for x in shuffled]),
+        ('< other item', lambda: [x < last for x in shuffled]),
+        ('sorted', lambda: sorted(shuffled)),
+        ('is_<name>', lambda: [x.is_item_10 for x in shuffled]),
+    ]
+
+
+def main():
+    results = {}
+    for enum in (Legacy, Fast):
+        for name, func in scenarios(enum):
+            seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+            results.setdefault(name, []).append(seconds / NUMBER / len(enum) * 1e9)
+
+    print('{:<16} {:>12} {:>12} {:>8}'.format('', 'legacy ns', 'fast ns', 'speedup'))
+    for name, (legacy, fast) in results.items():
+        print('{:<16} {:>12.1f} {:>12.1f} {:>7.1f}x'.format(name, legacy, fast, legacy / fast))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+# coding: utf-8
+"""
+``ChoicesEnum`` core operations: lookups, labels, hashing and comparisons.
+"""
+from __future__ import absolute_import, unicode_literals
+
+from .enums import HIT_RATIOS, SIZES, colors, inputs, statuses
+
+
+def _lookups(enum, prefix):
+    hits = inputs(enum, 1.0)
+    yield '{}call'.format(prefix), lambda: [enum(x) for x in hits], len(hits)
+
+    for ratio in HIT_RATIOS:
+        values = inputs(enum, ratio)
+        suffix = '[hit={:.0%}]'.format(ratio)
+        yield '{}get{}'.format(prefix, suffix), lambda: [enum.get(x) for x in values], len(values)
+        yield '{}in{}'.format(prefix, suffix), lambda: [x in enum for x in values], len(values)
+        yield ('{}from_values{}'.format(prefix, suffix),
+               lambda: enum.from_values(values, errors='default'), len(values))
+
+
+def _items(enum, prefix):
+    members = enum.from_values(inputs(enum, 1.0))
+    first = members[0]
+    yield '{}choices'.format(prefix), enum.choices, 1
+    yield '{}display'.format(prefix), lambda: [x.display for x in members], len(members)
+    yield '{}hash'.format(prefix), lambda: [hash(x) for x in members], len(members)
+    yield '{}eq_item'.format(prefix), lambda: [x == first for x in members], len(members)
+    yield '{}eq_value'.format(prefix), lambda: [x == 200 for x in members], len(members)
+    yield '{}sorted'.format(prefix), lambda: sorted(members), len(members)
+
+
+def benchmarks():
+    for size in SIZES:
+        for factory in (colors, statuses):
+            enum = factory(size)
+            prefix = 'core.{}[{}].'.format(factory.__name__, size)
+            for benchmark in _lookups(enum, prefix):
+                yield benchmark
+            for benchmark in _items(enum, prefix):
+                yield benchmark
@@ -0,0 +1,63 @@
+# coding: utf-8
+"""
+Class creation of large generated enums, with ``ChoicesEnum.from_table``.
+
+Run it directly to also report the memory used by a 10000 items enum::
+
+    $ python -m benchmarks.bench_creation
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import gc
+import time
+import tracemalloc
+
+from enum import Enum
+
+from choicesenum import ChoicesEnum
+
+SIZES = (50, 1000, 10000)
+
+
+def rows(size):
+    return [('ITEM_{}'.format(i), 'code-{}'.format(i), 'Item {}'.format(i)) for i in range(size)]
+
+
+def benchmarks():
+    for size in SIZES:
+        table = rows(size)
+        yield ('creation.from_table[{}]'.format(size),
+               lambda: ChoicesEnum.from_table('Generated', table), 1)
+
+
+def measure(label, factory):
+    "Time a call of `factory`, then trace the memory retained by another one."
+    gc.collect()
+    started = time.time()
+    factory()
+    elapsed = time.time() - started
+
+    gc.collect()
+    tracemalloc.start()
+    enum = factory()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('{:<36} {:>8.1f} ms {:>10.1f} KiB'.format(label, elapsed * 1e3, size / 1024.))
+    return enum
+
+
+def main(size=10000):
+    table = rows(size)
+    plain = [(name, value) for name, value, _ in table]
+    measure('enum.Enum (no labels)', lambda: Enum('Plain', plain))
+    enum = measure('ChoicesEnum.from_table', lambda: ChoicesEnum.from_table('Generated', table))
+
+    def predicates():
+        enum._predicates_ = None
+        return enum._get_predicates()
+
+    measure('... is_<name> table (first use)', predicates)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# coding: utf-8
+"""
+Django field conversions and queryset loading on an in-memory SQLite
+database. Skipped when Django is not installed.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import os
+
+from .enums import SIZES, colors, inputs, statuses
+
+ROWS = 10000
+
+
+def _setup():
+    try:
+        import django
+    except ImportError:  # pragma: no cover
+        return False
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+    django.setup()
+    return True
+
+
+def _fields():
+    from choicesenum.django.fields import EnumCharField, EnumIntegerField
+
+    for size in SIZES:
+        for factory, field_cls in ((colors, EnumCharField), (statuses, EnumIntegerField)):
+            enum = factory(size)
+            field = field_cls(enum=enum)
+            values = inputs(enum, 1.0)
+            members = enum.from_values(values)
+            prefix = 'django.{}[{}].'.format(factory.__name__, size)
+
+            yield ('{}from_db_value'.format(prefix),
+                   lambda: [field.from_db_value(x, None, None) for x in values], len(values))
+            yield ('{}get_prep_value'.format(prefix),
+                   lambda: [field.get_prep_value(x) for x in members], len(members))
+            yield ('{}get_prep_value[raw]'.format(prefix),
+                   lambda: [field.get_prep_value(x) for x in values], len(values))
+            yield ('{}get_prep_values'.format(prefix),
+                   lambda: field.get_prep_values(values), len(values))
+
+
+def _instances():
+    from tests.app.models import User, UserStatus
+
+    members = UserStatus.options() * 200
+    values = UserStatus.values() * 200
+    yield ('django.init.User[members]',
+           lambda: [User(status=x) for x in members], len(members))
+    yield ('django.init.User[values]',
+           lambda: [User(status=x) for x in values], len(values))
+
+
+def _create_rows():
+    from django.db import connection
+    from tests.app.models import ColorModel, User, UserStatus
+    from tests.app.enums import Color
+
+    with connection.schema_editor() as editor:
+        for model in (ColorModel, User):
+            editor.create_model(model)
+
+    colors, statuses = Color.options(), UserStatus.options()
+    ColorModel.objects.bulk_create(
+        ColorModel(color=colors[i % len(colors)]) for i in range(ROWS))
+    User.objects.bulk_create(
+        User(username='user', status=statuses[i % len(statuses)]) for i in range(ROWS))
+
+
+def _querysets():
+    from tests.app.models import ColorModel, User
+
+    _create_rows()
+    for model, name in ((ColorModel, 'color'), (User, 'status')):
+        prefix = 'django.queryset.{}.'.format(model.__name__)
+        queryset = model.objects.all()
+        yield ('{}iterator'.format(prefix),
+               lambda: [getattr(x, name) for x in queryset.iterator()], ROWS)
+        yield ('{}values_list'.format(prefix),
+               lambda: list(queryset.values_list(name, flat=True)), ROWS)
+
+
+def benchmarks():
+    if not _setup():
+        return
+    for benchmark in _fields():
+        yield benchmark
+    for benchmark in _instances():
+        yield benchmark
+    for benchmark in _querysets():
+        yield benchmark
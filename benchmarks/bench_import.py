@@ -0,0 +1,71 @@
+# coding: utf-8
+"""
+Import time of a models module whose fields refer to an expensive enum
+module, with the enum given as a class (imported right away) and as a
+dotted path (imported on first use).
+
+Each case runs in a fresh interpreter::
+
+    $ python -m benchmarks.bench_import
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ENUMS = '''
+from choicesenum import ChoicesEnum
+
+Catalog = ChoicesEnum.from_table('Catalog', [
+    ('ITEM_{}'.format(i), 'code-{}'.format(i), 'Item {}'.format(i)) for i in range(10000)
+])
+'''
+
+MODELS = '''
+from choicesenum.django.fields import EnumCharField
+{import_line}
+
+fields = [EnumCharField(enum={reference}, max_length=10) for _ in range(20)]
+'''
+
+CASES = (
+    ('enum class', 'from bench_catalog import Catalog', 'Catalog'),
+    ('enum path', '', "'bench_catalog.Catalog'"),
+)
+
+TIMER = '''
+import sys, time
+import django.db.models
+started = time.time()
+import bench_models
+sys.stdout.write(str(time.time() - started))
+'''
+
+
+def run(directory, repeat=5):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory] + sys.path))
+    timings = [
+        float(subprocess.check_output([sys.executable, '-c', TIMER], env=env))
+        for _ in range(repeat)
+    ]
+    return min(timings)
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(directory, 'bench_catalog.py'), 'w') as module:
+            module.write(ENUMS)
+        for label, import_line, reference in CASES:
+            with open(os.path.join(directory, 'bench_models.py'), 'w') as module:
+                module.write(MODELS.format(import_line=import_line, reference=reference))
+            print('{:<24} {:>8.1f} ms'.format(label, run(directory) * 1e3))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
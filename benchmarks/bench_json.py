@@ -0,0 +1,68 @@
+# coding: utf-8
+"""
+JSON encoding of a 1M elements payload, a third of them ``ChoicesEnum``
+items, with the global ``patch_json``, with the scoped alternatives of
+``choicesenum.serialization`` and as NDJSON to ``os.devnull``::
+
+    $ python -m benchmarks.bench_json
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import json
+import os
+import time
+
+from choicesenum.patches import patched_json
+from choicesenum.serialization import ChoicesJSONEncoder, json_default, write_ndjson
+
+from .enums import statuses
+
+SIZE = 1000000
+
+
+def payload(size=SIZE):
+    members = statuses(50).options()
+    return [
+        {'id': i, 'status': members[i % len(members)], 'name': 'row {}'.format(i)}
+        for i in range(size // 3)
+    ]
+
+
+def cases():
+    yield 'patch_json', _patched_dumps
+    yield 'json.dumps(default=json_default)', lambda data: json.dumps(data, default=json_default)
+    yield 'json.dumps(cls=ChoicesJSONEncoder)', lambda data: json.dumps(
+        data, cls=ChoicesJSONEncoder)
+    yield 'write_ndjson', _write_ndjson
+    yield 'write_ndjson(display=True)', lambda data: _write_ndjson(data, display=True)
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover
+        return
+    yield 'orjson.dumps(default=json_default)', lambda data: orjson.dumps(
+        data, default=json_default)
+
+
+def _patched_dumps(data):
+    with patched_json():
+        return json.dumps(data)
+
+
+def _write_ndjson(data, display=False):
+    with open(os.devnull, 'w') as stream:
+        return write_ndjson(data, stream, display=display)
+
+
+def main(repeat=3):
+    data = payload()
+    for label, dumps in cases():
+        timings = []
+        for _ in range(repeat):
+            started = time.time()
+            dumps(data)
+            timings.append(time.time() - started)
+        print('{:<40} {:>8.1f} ms'.format(label, min(timings) * 1e3))
+
+
+if __name__ == '__main__':
+    main()
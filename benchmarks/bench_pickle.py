@@ -0,0 +1,52 @@
+# coding: utf-8
+"""
+Size and speed of pickles of items, with the default ``Enum`` reduction and
+with ``choicesenum.pickling.enable_compact_pickle``::
+
+    $ python -m benchmarks.bench_pickle
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pickle
+import timeit
+
+from choicesenum import ChoicesEnum
+from choicesenum.pickling import disable_compact_pickle, enable_compact_pickle
+
+NUMBER = 200
+
+# module level, so the default pickling can find them
+Color = ChoicesEnum('Color', [('COLOR_{}'.format(i), '#{:06x}'.format(i)) for i in range(50)])
+Status = ChoicesEnum('Status', [('STATUS_{}'.format(i), 100 + i) for i in range(50)])
+
+
+def payloads():
+    color, status = Color, Status
+    yield 'one item', color.options()[7]
+    yield 'items of 2 enums', [color.options()[1], status.options()[2]]
+    yield '1000 rows', [
+        {'color': color.options()[i % 50], 'status': status.options()[i % 7]}
+        for i in range(1000)
+    ]
+
+
+def measure(label, payload):
+    data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    dumps = min(timeit.repeat(
+        lambda: pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), number=NUMBER, repeat=5))
+    loads = min(timeit.repeat(lambda: pickle.loads(data), number=NUMBER, repeat=5))
+    print('{:<28} {:>7} bytes   dumps {:>8.1f} us   loads {:>8.1f} us'.format(
+        label, len(data), dumps / NUMBER * 1e6, loads / NUMBER * 1e6))
+
+
+def main():
+    enums = (Color, Status)
+    for label, payload in payloads():
+        measure('{} (default)'.format(label), payload)
+        enable_compact_pickle(*enums)
+        measure('{} (compact)'.format(label), payload)
+        disable_compact_pickle(*enums)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# coding: utf-8
+"""
+Import and export of 100k items payloads with the schematics types, against
+the previous ``ChoicesEnumType``, which called the enum for every value::
+
+    $ python -m benchmarks.bench_schematics
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from schematics.models import Model
+from schematics.types import ListType, ModelType
+
+from choicesenum.schematics.types import ChoicesEnumListType, ChoicesEnumType
+
+from .enums import statuses
+
+SIZE = 100000
+Status = statuses(50)
+
+
+class LegacyChoicesEnumType(ChoicesEnumType):
+
+    def to_native(self, value, context=None):
+        return self.type(value)
+
+    def to_primitive(self, value, context=None):
+        return self.type(value).value
+
+
+def _schemas(type_cls):
+    class Event(Model):
+        status = type_cls(Status)
+
+    class Batch(Model):
+        events = ListType(ModelType(Event))
+
+    return Batch
+
+
+def _list_schema(field):
+    class Statuses(Model):
+        statuses = field
+
+    return Statuses
+
+
+def cases():
+    values = [Status.values()[i % 50] for i in range(SIZE)]
+    events = {'events': [{'status': value} for value in values]}
+    for label, type_cls in (('legacy', LegacyChoicesEnumType), ('current', ChoicesEnumType)):
+        schema = _schemas(type_cls)
+        yield 'models[{}]'.format(label), schema, events
+        yield 'ListType({})'.format(label), _list_schema(ListType(type_cls(Status))), {
+            'statuses': values}
+    yield 'ChoicesEnumListType', _list_schema(ChoicesEnumListType(Status)), {'statuses': values}
+
+
+def measure(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        started = time.time()
+        result = func()
+        timings.append(time.time() - started)
+    return min(timings), result
+
+
+def main():
+    for label, schema, payload in cases():
+        imported, instance = measure(lambda: schema(payload))
+        exported, _ = measure(instance.to_primitive)
+        print('{:<28} import {:>8.1f} ms   to_primitive {:>8.1f} ms'.format(
+            label, imported * 1e3, exported * 1e3))
+
+
+if __name__ == '__main__':
+    main()
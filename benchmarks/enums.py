@@ -0,0 +1,52 @@
+# coding: utf-8
+"""
+Enums of several sizes, shaped after ``tests/app/enums.py``, and inputs with a
+given ratio of valid (hit) and invalid (miss) values.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import random
+
+from choicesenum import ChoicesEnum
+
+SIZES = (3, 50, 1000, 10000)
+HIT_RATIOS = (1.0, 0.5, 0.0)
+INPUT_SIZE = 1000
+
+_cache = {}
+
+
+def colors(size):
+    "Like `Color`: string values with explicit labels."
+    key = ('colors', size)
+    if key not in _cache:
+        _cache[key] = ChoicesEnum('Colors{}'.format(size), [
+            ('COLOR_{}'.format(i), ('#{:06x}'.format(i), 'Color {}'.format(i)))
+            for i in range(size)
+        ])
+    return _cache[key]
+
+
+def statuses(size):
+    "Like `HttpStatus`: integer values with labels derived from the names."
+    key = ('statuses', size)
+    if key not in _cache:
+        _cache[key] = ChoicesEnum('Statuses{}'.format(size), [
+            ('STATUS_{}'.format(i), 100 + i) for i in range(size)
+        ])
+    return _cache[key]
+
+
+def inputs(enum, hit_ratio, size=INPUT_SIZE, seed=42):
+    """
+    Returns `size` raw values, `hit_ratio` of them valid for `enum` and the
+    rest of the same type but invalid.
+    """
+    rnd = random.Random(seed)
+    values = enum.values()
+    hits = int(size * hit_ratio)
+    sample = type(values[0])
+    misses = [sample(-1) if sample is int else '#missing{}'.format(i) for i in range(size - hits)]
+    result = [rnd.choice(values) for _ in range(hits)] + misses
+    rnd.shuffle(result)
+    return result
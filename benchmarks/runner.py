@@ -0,0 +1,77 @@
+# coding: utf-8
+"""
+A small, dependency free benchmark runner.
+
+Benchmark modules expose a ``benchmarks()`` generator of
+``(name, func, operations)`` tuples, where ``operations`` is how many
+operations a single ``func()`` call performs. Results are reported in
+nanoseconds per operation (best of several repeats).
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import importlib
+import json
+import platform
+import sys
+import timeit
+
+import choicesenum
+
+MODULES = (
+    'benchmarks.bench_core',
+    'benchmarks.bench_creation',
+    'benchmarks.bench_django',
+)
+
+
+def collect(keyword=None):
+    for module_name in MODULES:
+        module = importlib.import_module(module_name)
+        for name, func, operations in module.benchmarks():
+            if keyword is None or keyword in name:
+                yield name, func, operations
+
+
+def measure(func, operations, repeat=3):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number / operations * 1e9
+
+
+def run(keyword=None, repeat=3, out=sys.stdout):
+    results = {}
+    for name, func, operations in collect(keyword):
+        results[name] = measure(func, operations, repeat=repeat)
+        print('{:<48} {:>12.1f} ns/op'.format(name, results[name]), file=out)
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'choicesenum': choicesenum.__version__,
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    Returns the ``(name, baseline_ns, current_ns, ratio)`` of every benchmark
+    present in both runs, and the names of the ones slower than ``threshold``.
+    """
+    rows = []
+    for name, value in sorted(current['results'].items()):
+        if name in baseline['results']:
+            base = baseline['results'][name]
+            rows.append((name, base, value, value / base))
+    regressions = [row[0] for row in rows if row[3] > threshold]
+    return rows, regressions
+
+
+def load(path):
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def dump(data, path):
+    with open(path, 'w') as fp:
+        json.dump(data, fp, indent=2, sort_keys=True)
+        fp.write('\n')
@@ -5,7 +5,8 @@ __author__ = """Fernando Macedo"""
 __email__ = 'fgmacedo@gmail.com'
 __version__ = '0.7.0'
 
-__all__ = ('ChoicesEnum', )
+__all__ = ('ChoicesEnum', 'ChoicesEnumSet', )
 
 
 from .enums import ChoicesEnum
+from .sets import ChoicesEnumSet
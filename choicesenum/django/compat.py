@@ -19,7 +19,26 @@ class Creator(DeferredAttribute):
             super(Creator, self).__init__(field.attname)
         else:  # pragma: no cover
             super(Creator, self).__init__(field)
+        self.attname = getattr(self, 'field_name', field.attname)
 
     def __set__(self, obj, value):
-        field_name = getattr(self, 'field_name', self.field.attname)
-        obj.__dict__[field_name] = self.field.to_python(value)
+        # Members are stored as is, eg. the ones converted by `from_db_value`
+        # when Model.__init__ hydrates rows.
+        if value.__class__ is not self.field.enum:
+            value = self.field.to_python(value)
+        obj.__dict__[self.attname] = value
+
+
+class LazyCreator(Creator):
+    """
+    Stores assigned values as is and converts them to enum members when the
+    attribute is first read. Used by fields with ``lazy_coercion=True``.
+    """
+    def __set__(self, obj, value):
+        obj.__dict__[self.attname] = value
+
+    def __get__(self, instance, cls=None):
+        value = super(LazyCreator, self).__get__(instance, cls)
+        if instance is not None and value.__class__ is not self.field.enum:
+            value = instance.__dict__[self.attname] = self.field.to_python(value)
+        return value
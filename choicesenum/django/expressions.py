@@ -0,0 +1,26 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+from django.db import models
+
+import six
+
+
+class EnumDisplay(models.Case):
+    """
+    A ``CASE`` expression mapping the values of an enum field to the item
+    labels, so they can be annotated, filtered or sorted by the database::
+
+        User.objects.annotate(status_display=EnumDisplay('status', UserStatus))
+
+    Labels are resolved in the language active when the expression is built.
+    """
+
+    def __init__(self, field_name, enum, default='', **extra):
+        whens = [
+            models.When(**{field_name: member, 'then': models.Value(six.text_type(label))})
+            for member, label in enum.choices()
+        ]
+        super(EnumDisplay, self).__init__(
+            *whens, default=models.Value(default), output_field=models.CharField(), **extra)
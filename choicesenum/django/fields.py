@@ -2,8 +2,17 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import logging
+import re
+import time
+
+from django.apps import apps
 from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
 from django.db import models
+from django.dispatch import receiver
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 try:
     from django.utils.module_loading import import_string
@@ -12,78 +21,179 @@ except ImportError:  # pragma: no cover, Django 1.6 compat
 
 import six
 
-from .compat import Creator
-from ..enums import ChoicesEnum
+from .compat import Creator, LazyCreator
+from .lookups import EnumIn, EnumInSet, EnumIs, EnumSetHas, EnumSetHasAll, EnumSetHasAny
+from .operations import AddEnumValues, CreateEnumType
+from .. import registry
+from ..enums import _MISSING, ChoicesEnum, clear_display_cache
+from ..sets import ChoicesEnumSet
+
+TRANSLATION_SETTINGS = ('LANGUAGE_CODE', 'LANGUAGES', 'LOCALE_PATHS', 'USE_I18N')
+
+logger = logging.getLogger(__name__)
+
+# (enum, value) -> whether the value is valid, shared by the system checks of
+# every field with the same enum, `null` and default
+_valid_values = {}
+
+
+def _is_valid_value(enum, value):
+    "Memoized ``value in enum``, without raising for invalid values."
+    key = (enum, value)
+    try:
+        return _valid_values[key]
+    except KeyError:
+        valid = _valid_values[key] = enum._get_member(value, _MISSING) is not _MISSING
+        return valid
+    except TypeError:  # unhashable default
+        return enum._get_member(value, _MISSING) is not _MISSING
 
 
 class FieldErrors(ChoicesEnum):
     E01 = 'choicesenum.E01', _("{cls} has `null=True` but {enum} does not have an item with "
                                "value `None`.")
     E02 = 'choicesenum.E02', _("{cls}: '{default}' is not a valid default for '{enum}'.")
+    E03 = 'choicesenum.E03', _("{cls}: codes for '{enum}' must be unique integers from 0 to "
+                               "{max_code}, one for each item.")
+    E04 = 'choicesenum.E04', _("{cls}: native enum types only support text values, "
+                               "'{enum}' has {value!r}.")
+    E05 = 'choicesenum.E05', _("{cls}: '{enum}' has {size} items, bitmasks fit up to "
+                               "{max_items}.")
+    W01 = 'choicesenum.W01', _("{cls}: the values {values} of the enum type '{type_name}' "
+                               "aren't added by any migration.")
 
 
-class EnumFieldMixin(object):
+class LazyChoices(object):
+    """
+    The ``choices`` of a field whose enum is given as a dotted path, read
+    from the enum on first use.
+    """
 
-    def __init__(self, enum=None, **kwargs):
+    def __init__(self, field):
+        self.field = field
+
+    def __iter__(self):
+        return iter(self.field.enum.choices())
+
+    def __len__(self):
+        return len(self.field.enum.choices())
+
+    def __bool__(self):
+        # Django < 3.0 does `choices or []` in `Field.__init__`, before the enum
+        # can be imported. Enums always have items.
+        return True
+
+    __nonzero__ = __bool__
+
+
+def _resolve_enum(path):
+    "Registered enums are resolved without importing, see `choicesenum.registry`."
+    return registry.get(path) or import_string(path)
+
+
+class LazyEnumMixin(object):
+    """
+    Accepts the enum as a class or as a dotted path, imported on first use
+    of ``.enum``. Models can then refer to enums without importing them.
+    """
+
+    def _set_enum(self, enum):
+        if isinstance(enum, six.string_types):
+            self._enum_path = enum
+        else:
+            self.enum = enum
+
+    @cached_property
+    def enum(self):
+        return _resolve_enum(self._enum_path)
+
+
+class EnumFieldMixin(LazyEnumMixin):
+
+    def __init__(self, enum=None, lazy_coercion=False, check_constraint=False, **kwargs):
         choices = kwargs.pop('choices', None)
-        if enum and isinstance(enum, six.string_types):
-            enum = import_string(enum)
+        if check_constraint and not hasattr(models, 'CheckConstraint'):  # pragma: no cover
+            raise ImproperlyConfigured('`check_constraint` requires Django 2.2+.')
 
+        self._set_enum(enum)
         if choices is None and enum:
-            choices = enum.choices()
+            choices = LazyChoices(self) if isinstance(enum, six.string_types) else enum.choices()
         kwargs['choices'] = choices
-        self.enum = enum
+        self.lazy_coercion = lazy_coercion
+        self.check_constraint = check_constraint
         super(EnumFieldMixin, self).__init__(**kwargs)
 
+    @cached_property
+    def _value_index(self):
+        "Raw value -> member, read once from the enum for the row converters."
+        return self.enum._value_index_ if self.enum else {}
+
     def check(self, **kwargs):
+        started = time.time()
         try:
             errors = super(EnumFieldMixin, self).check(**kwargs)
-        except BaseException:
+        except Exception:  # eg. fields not bound to a model
             errors = []
         errors.extend(self._check_null(**kwargs))
         errors.extend(self._check_default(**kwargs))
+        logger.debug('Checked %r in %.3f ms', self, (time.time() - started) * 1e3)
         return errors
 
     def _check_null(self, **kwargs):
-        if self.null:
-            try:
-                self.enum(None)
-                return []
-            except ValueError:
-                return [
-                    checks.Error(
-                        FieldErrors.E01.display.format(
-                            cls=self.__class__.__name__, enum=self.enum,),
-                        obj=self,
-                        id=FieldErrors.E01,
-                        hint=_('Add an enum item with `None` as value, eg.: '
-                               '`UNDEFINED = None`, or turn `null=False`.'),
-                    )
-                ]
-        return []
+        if not self.null or _is_valid_value(self.enum, None):
+            return []
+        return [
+            checks.Error(
+                FieldErrors.E01.display.format(
+                    cls=self.__class__.__name__, enum=self.enum,),
+                obj=self,
+                id=FieldErrors.E01,
+                hint=_('Add an enum item with `None` as value, eg.: '
+                       '`UNDEFINED = None`, or turn `null=False`.'),
+            )
+        ]
 
     def _check_default(self, **kwargs):
-        try:
-            default = self.get_default()
-            self.enum(default)
+        default = self.get_default()
+        if _is_valid_value(self.enum, default):
             return []
-        except ValueError:
-            return [
-                checks.Error(
-                    FieldErrors.E02.display.format(
-                        cls=self.__class__.__name__, default=default, enum=self.enum,),
-                    obj=self,
-                    id=FieldErrors.E02,
-                    hint=_('Add an enum item with `{0!r}` as value, eg.: `UNDEFINED = {0!r}`, '
-                           'or inform a valid default value.').format(default),
-                )
-            ]
+        return [
+            checks.Error(
+                FieldErrors.E02.display.format(
+                    cls=self.__class__.__name__, default=default, enum=self.enum,),
+                obj=self,
+                id=FieldErrors.E02,
+                hint=_('Add an enum item with `{0!r}` as value, eg.: `UNDEFINED = {0!r}`, '
+                       'or inform a valid default value.').format(default),
+            )
+        ]
 
     def contribute_to_class(self, cls, name):
         # Retain to_python behaviour for < Django 1.8 with removal
         # of SubfieldBase
         super(EnumFieldMixin, self).contribute_to_class(cls, name)
-        setattr(cls, name, Creator(self, cls))
+        creator_cls = LazyCreator if self.lazy_coercion else Creator
+        setattr(cls, name, creator_cls(self, cls))
+        if self.check_constraint:
+            self._add_check_constraint(cls)
+
+    def _add_check_constraint(self, cls):
+        # Historical models, rendered from the migration state, already have the
+        # constraint of their migration, with the enum values of that time.
+        if cls._meta.abstract or cls.__module__ == '__fake__':
+            return
+        name = '{}_{}_enum'.format(cls._meta.db_table, self.name)
+        if any(constraint.name == name for constraint in cls._meta.constraints):
+            return  # declared in `Meta`
+        values = [value for value in self.enum.values() if value is not None]
+        check = models.Q(**{'{}__in'.format(self.name): values})
+        if self.null:
+            check |= models.Q(**{'{}__isnull'.format(self.name): True})
+        # a new list, `constraints` may be shared with other models through `Meta`.
+        # The migration state copies the constraints of the models declaring them in
+        # `Meta`, ie. having them in `original_attrs`.
+        cls._meta.constraints = cls._meta.original_attrs['constraints'] = list(
+            cls._meta.constraints) + [models.CheckConstraint(check=check, name=name)]
 
     def to_python(self, value):
         if isinstance(value, self.enum):
@@ -93,27 +203,66 @@ class EnumFieldMixin(object):
 
     def from_db_value(self, value, *args, **kwargs):
         try:
-            return self.enum(value)
-        except ValueError:
-            # We need to return None here even if the enum has no None value
-            # to support models being fetched via select_related.
-            # The row converters are run before the pk=None check in
-            # the default Django model managers.
-            if value is None:
-                return value
-
-            # For certain operations on Postgres ArrayFields and Array
-            # aggregation, we need to handle list values
-            if type(value) == list:
-                return list(filter(None, [
-                    self.from_db_value(x, *args, **kwargs)
-                    for x in value
-                ]))
-            raise
+            member = self._value_index.get(value, _MISSING)
+        except TypeError:  # unhashable values, eg. lists
+            return self._from_db_unhashable(value)
+        if member is _MISSING:
+            return self._from_db_missing(value)
+        return member
+
+    def _from_db_missing(self, value):
+        # We need to return None here even if the enum has no None value
+        # to support models being fetched via select_related.
+        # The row converters are run before the pk=None check in
+        # the default Django model managers.
+        if value is None:
+            return value
+        return self.enum(value)  # custom `_missing_` hook, or ValueError
+
+    def _from_db_unhashable(self, value):
+        # For certain operations on Postgres ArrayFields and Array
+        # aggregation, we need to handle list values
+        if type(value) is list:
+            return self.from_db_array(value)
+        return self.enum(value)
+
+    def from_db_array(self, values):
+        """
+        Converts a list of values, eg. from Postgres arrays or ``ArrayAgg``,
+        dropping NULLs.
+        """
+        members = [
+            self.from_db_value(value) if member is _MISSING else member
+            for value, member in zip(values, self.enum._get_members(values))
+        ]
+        return [member for member in members if member is not None]
 
     def get_prep_value(self, value):
-        enum_value = self.to_python(value)
-        return getattr(enum_value, 'value', value)
+        if value.__class__ is self.enum:
+            return value._value_
+        try:
+            member = self._value_index.get(value, _MISSING)
+        except TypeError:  # unhashable values
+            member = _MISSING
+        if member is _MISSING:
+            member = self.to_python(value)
+        return member._value_
+
+    def get_prep_values(self, values):
+        """
+        Bulk version of ``get_prep_value``, used by the ``__in`` lookup.
+        Expressions are kept as is.
+        """
+        values = list(values)
+        return [
+            self._get_prep_missing(value) if member is _MISSING else member._value_
+            for value, member in zip(values, self.enum._get_members(values))
+        ]
+
+    def _get_prep_missing(self, value):
+        if hasattr(value, 'resolve_expression'):
+            return value
+        return self.get_prep_value(value)  # parent field conversion, or ValueError
 
     def deconstruct(self):
         name, path, args, kwargs = super(EnumFieldMixin, self).deconstruct()
@@ -121,6 +270,11 @@ class EnumFieldMixin(object):
         if 'default' in kwargs and self.default:
             kwargs['default'] = self.to_python(self.default).value
 
+        kwargs.update(
+            (option, True) for option in ('lazy_coercion', 'check_constraint')
+            if getattr(self, option)
+        )
+
         if self.enum:
             kwargs["enum"] = self.enum
             if 'choices' in kwargs:  # pragma: no cover
@@ -144,3 +298,339 @@ class EnumCharField(get_base_classes(models.CharField)):
 
 class EnumIntegerField(get_base_classes(models.IntegerField)):
     description = "An integer enum field"
+
+
+class EnumSmallIntegerField(get_base_classes(models.SmallIntegerField)):
+    description = "A small integer enum field"
+
+
+class EnumOrdinalField(get_base_classes(models.PositiveSmallIntegerField)):
+    """
+    Stores a small integer code instead of the item value, eg. a string enum
+    in a ``smallint`` column. Codes default to the item ordinals, so new items
+    must be added at the end of the enum, or explicit ``codes`` (a mapping of
+    items or values to integers) must be given.
+
+    The item with value ``None``, if any, is stored as ``NULL``.
+    """
+    description = "An enum field stored as a small integer code"
+    max_code = 32767
+
+    def __init__(self, enum=None, codes=None, **kwargs):
+        self.explicit_codes = codes is not None
+        self._codes_option = codes
+        super(EnumOrdinalField, self).__init__(enum=enum, **kwargs)
+
+    @cached_property
+    def _codes(self):
+        enum = self.enum
+        if self._codes_option is None:
+            codes = dict((member, member._ordinal_) for member in enum.options())
+        else:  # unknown keys, eg. of removed items, are reported by `_check_codes`
+            codes = dict(item for item in self._explicit_codes() if item[0] is not _MISSING)
+        for member in enum.options():
+            if member._value_ is None:
+                codes[member] = None
+        # items are hashed by value, so the codes can be looked up by values too
+        return codes
+
+    def _explicit_codes(self):
+        "(item or `_MISSING`, code) pairs of the `codes` option."
+        return [
+            (self.enum._get_member(key, _MISSING), code)
+            for key, code in self._codes_option.items()
+        ]
+
+    @cached_property
+    def _members_by_code(self):
+        return dict((code, member) for member, code in self._codes.items())
+
+    @cached_property
+    def _members_by_text(self):
+        return dict((six.text_type(member._value_), member) for member in self.enum.options())
+
+    @cached_property
+    def validators(self):
+        # Without the integer range validators of the database, which would compare
+        # the items with ints. The range of the codes is checked by `_check_codes`.
+        return super(models.IntegerField, self).validators
+
+    def check(self, **kwargs):
+        errors = super(EnumOrdinalField, self).check(**kwargs)
+        errors.extend(self._check_codes())
+        return errors
+
+    def _check_codes(self):
+        codes = [code for code in self._codes.values() if code is not None]
+        unknown = self.explicit_codes and any(
+            member is _MISSING for member, code in self._explicit_codes())
+        valid = (
+            not unknown and
+            len(self._codes) == len(self.enum.options()) and
+            len(set(codes)) == len(codes) and
+            all(isinstance(code, six.integer_types) and 0 <= code <= self.max_code
+                for code in codes)
+        )
+        if valid:
+            return []
+        return [
+            checks.Error(
+                FieldErrors.E03.display.format(
+                    cls=self.__class__.__name__, enum=self.enum, max_code=self.max_code),
+                obj=self,
+                id=FieldErrors.E03,
+            )
+        ]
+
+    def to_python(self, value):
+        if isinstance(value, self.enum):
+            return value
+        member = self.enum._get_member(value, _MISSING)
+        if member is _MISSING and isinstance(value, six.string_types):
+            member = self._members_by_text.get(value, _MISSING)  # eg. form data
+        if member is _MISSING:
+            return self.enum(value)  # ValueError
+        return member
+
+    def from_db_value(self, value, *args, **kwargs):
+        member = self._members_by_code.get(value, _MISSING)
+        if member is not _MISSING:
+            return member
+        if value is None:  # see `EnumFieldMixin._from_db_missing`
+            return value
+        if type(value) is list:
+            return self.from_db_array(value)
+        raise ValueError('{!r} is not a valid code for {}'.format(value, self.enum.__name__))
+
+    def from_db_array(self, values):
+        members = [self.from_db_value(value) for value in values]
+        return [member for member in members if member is not None]
+
+    def get_prep_value(self, value):
+        if value.__class__ is not self.enum:
+            value = self.to_python(value)
+        return self._codes[value]
+
+    def get_prep_values(self, values):
+        return [
+            value if hasattr(value, 'resolve_expression') else self.get_prep_value(value)
+            for value in values
+        ]
+
+    def deconstruct(self):
+        name, path, args, kwargs = super(EnumOrdinalField, self).deconstruct()
+        if self.explicit_codes:
+            kwargs['codes'] = dict(
+                (member._value_, code) for member, code in self._codes.items()
+                if code is not None
+            )
+        return name, path, args, kwargs
+
+
+def _type_name(enum):
+    "Snake case name of the enum class or dotted path, eg. `user_status`."
+    name = enum.rsplit('.', 1)[-1] if isinstance(enum, six.string_types) else enum.__name__
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+
+class EnumNativeField(EnumCharField):
+    """
+    A string enum field stored in a Postgres ``ENUM`` type, created and
+    updated by the ``CreateEnumType`` and ``AddEnumValues`` migration
+    operations. Other databases use a ``varchar`` column.
+
+    The type is named after the enum (eg. ``user_status``) unless a
+    ``type_name`` is given. The type values are recorded in migrations, so
+    adding items to the enum changes the migration state.
+    """
+    description = "A string enum field stored in a native enum type"
+
+    def __init__(self, enum=None, type_name=None, type_values=None, **kwargs):
+        self.type_name = type_name or (enum and _type_name(enum))
+        self._type_values = type_values  # given by migrations
+        if enum and 'max_length' not in kwargs:
+            if isinstance(enum, six.string_types):  # the values are needed right away
+                enum = _resolve_enum(enum)
+            kwargs['max_length'] = max(
+                [len(six.text_type(value)) for value in enum.values() if value is not None] or [1])
+        super(EnumNativeField, self).__init__(enum=enum, **kwargs)
+
+    def type_values(self):
+        "The values of the database type: the enum values, but `None`."
+        if self._type_values is not None:
+            return list(self._type_values)
+        return [value for value in self.enum.values() if value is not None]
+
+    def db_type(self, connection):
+        if connection.vendor == 'postgresql':
+            return connection.ops.quote_name(self.type_name)
+        return super(EnumNativeField, self).db_type(connection)
+
+    def check(self, **kwargs):
+        errors = super(EnumNativeField, self).check(**kwargs)
+        errors.extend(self._check_type_values())
+        return errors
+
+    def _check_type_values(self):
+        for value in self.type_values():
+            if not isinstance(value, six.string_types):
+                return [
+                    checks.Error(
+                        FieldErrors.E04.display.format(
+                            cls=self.__class__.__name__, enum=self.enum, value=value),
+                        obj=self,
+                        id=FieldErrors.E04,
+                    )
+                ]
+        return []
+
+    def deconstruct(self):
+        name, path, args, kwargs = super(EnumNativeField, self).deconstruct()
+        kwargs['type_name'] = self.type_name
+        kwargs['type_values'] = self.type_values()
+        return name, path, args, kwargs
+
+
+class EnumSetField(LazyEnumMixin, models.BigIntegerField):
+    """
+    A set of enum items, stored as a bitmask over the item ordinals and
+    exposed as a ``ChoicesEnumSet``. New items must be added at the end of
+    the enum, like for ``EnumOrdinalField``.
+
+    Assigned values may be sets, iterables of items or values, or masks.
+    """
+    description = "A set of enum items stored as a bitmask"
+    max_items = 63
+
+    def __init__(self, enum=None, **kwargs):
+        self._set_enum(enum)
+        if not kwargs.get('null'):
+            kwargs.setdefault('default', 0)  # an empty set
+        super(EnumSetField, self).__init__(**kwargs)
+
+    @cached_property
+    def validators(self):
+        # Without the integer range validators of the database, which would compare
+        # the sets with ints. Masks fit, the number of items is checked by `_check_size`.
+        return super(models.IntegerField, self).validators
+
+    def check(self, **kwargs):
+        try:
+            errors = super(EnumSetField, self).check(**kwargs)
+        except Exception:
+            errors = []
+        errors.extend(self._check_size())
+        return errors
+
+    def _check_size(self):
+        size = len(self.enum.options())
+        if size <= self.max_items:
+            return []
+        return [
+            checks.Error(
+                FieldErrors.E05.display.format(
+                    cls=self.__class__.__name__, enum=self.enum, size=size,
+                    max_items=self.max_items),
+                obj=self,
+                id=FieldErrors.E05,
+            )
+        ]
+
+    def contribute_to_class(self, cls, name):
+        super(EnumSetField, self).contribute_to_class(cls, name)
+        setattr(cls, name, Creator(self, cls))
+
+    def to_python(self, value):
+        if value is None or isinstance(value, ChoicesEnumSet) and value.enum is self.enum:
+            return value
+        if isinstance(value, six.string_types + six.integer_types):  # a mask, eg. from fixtures
+            return ChoicesEnumSet.from_mask(self.enum, int(value))
+        return ChoicesEnumSet(self.enum, value)
+
+    def from_db_value(self, value, *args, **kwargs):
+        if value is None:
+            return value
+        return ChoicesEnumSet.from_mask(self.enum, value)
+
+    def get_prep_value(self, value):
+        value = self.to_python(value)
+        return None if value is None else value.mask
+
+    def value_to_string(self, obj):
+        return six.text_type(self.get_prep_value(self.value_from_object(obj)))
+
+    def deconstruct(self):
+        name, path, args, kwargs = super(EnumSetField, self).deconstruct()
+        kwargs['enum'] = self.enum
+        return name, path, args, kwargs
+
+
+for lookup in (EnumSetHas, EnumSetHasAll, EnumSetHasAny):
+    EnumSetField.register_lookup(lookup)
+
+for lookup in (EnumIn, EnumIs, EnumInSet):
+    for field_cls in (EnumCharField, EnumIntegerField, EnumSmallIntegerField, EnumOrdinalField):
+        field_cls.register_lookup(lookup)
+
+
+@receiver(setting_changed)
+def _clear_display_cache_on_translation_change(setting, **kwargs):
+    if setting in TRANSLATION_SETTINGS:
+        clear_display_cache()
+
+
+def _native_fields(app_configs):
+    return [
+        field
+        for app_config in app_configs or apps.get_app_configs()
+        for model in app_config.get_models()
+        for field in model._meta.local_fields if isinstance(field, EnumNativeField)
+    ]
+
+
+def _migrated_type_values():
+    """
+    The labels of the migrated apps, and the type name -> values created or
+    added by the ``CreateEnumType`` and ``AddEnumValues`` operations of their
+    migrations.
+    """
+    from django.db.migrations.loader import MigrationLoader
+
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    type_values = {}
+    for migration in loader.disk_migrations.values():
+        for operation in migration.operations:
+            if isinstance(operation, (CreateEnumType, AddEnumValues)):
+                type_values.setdefault(operation.name, set()).update(operation.values)
+    return loader.migrated_apps, type_values
+
+
+def _missing_type_values(field, type_values):
+    missing = [value for value in field.type_values() if value not in type_values]
+    operation = 'AddEnumValues' if type_values else 'CreateEnumType'
+    return checks.Warning(
+        FieldErrors.W01.display.format(
+            cls=field.__class__.__name__, values=missing, type_name=field.type_name),
+        obj=field,
+        id=FieldErrors.W01,
+        hint=_("Add `{0}({1!r}, {2!r})` to a migration, before the one using them.").format(
+            operation, field.type_name, missing),
+    )
+
+
+@checks.register(checks.Tags.models)
+def _check_enum_types(app_configs=None, **kwargs):
+    """
+    Warns about values of the ``EnumNativeField`` types missing from the
+    migrations, eg. after adding items to the enum.
+    """
+    fields = _native_fields(app_configs)
+    if not fields:
+        return []
+    migrated_apps, type_values = _migrated_type_values()
+    return [
+        _missing_type_values(field, type_values.get(field.type_name, set()))
+        for field in fields
+        if field.model._meta.app_label in migrated_apps and
+        not type_values.get(field.type_name, set()).issuperset(field.type_values())
+    ]
@@ -0,0 +1,105 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+from django.db.models import lookups
+try:
+    from django.core.exceptions import EmptyResultSet
+except ImportError:  # pragma: no cover, Django < 1.11 compat
+    from django.db.models.sql.datastructures import EmptyResultSet
+
+
+class EnumIn(lookups.In):
+    """
+    ``__in`` lookup that prepares the whole list of values with a single
+    call to ``EnumFieldMixin.get_prep_values``.
+    """
+
+    def get_prep_lookup(self):
+        if hasattr(self.rhs, 'resolve_expression') or not getattr(self, 'prepare_rhs', True):
+            return super(EnumIn, self).get_prep_lookup()
+        return self.lhs.output_field.get_prep_values(self.rhs)
+
+
+class EnumIs(lookups.Exact):
+    """
+    ``field__is=Enum.ITEM``: like ``exact``, but an item with value ``None``
+    (or ``None`` itself) becomes ``IS NULL``.
+    """
+    lookup_name = 'is'
+    can_use_none_as_rhs = True
+
+    def as_sql(self, compiler, connection):
+        if self.rhs is None:
+            lhs_sql, params = self.process_lhs(compiler, connection)
+            return '%s IS NULL' % lhs_sql, params
+        return super(EnumIs, self).as_sql(compiler, connection)
+
+    def get_rhs_op(self, connection, rhs):
+        return connection.operators['exact'] % rhs
+
+
+class EnumInSet(EnumIn):
+    """
+    ``field__in_set=items``, where ``items`` is a ``ChoicesEnumSet`` or any
+    iterable of items or values. An item with value ``None`` adds an
+    ``OR IS NULL`` clause, where the ``in`` lookup would just drop it.
+    """
+    lookup_name = 'in_set'
+
+    def as_sql(self, compiler, connection):
+        if not self.rhs_is_direct_value() or None not in self.rhs:
+            return super(EnumInSet, self).as_sql(compiler, connection)
+
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        is_null = '%s IS NULL' % lhs_sql
+        try:
+            sql, params = super(EnumInSet, self).as_sql(compiler, connection)
+        except EmptyResultSet:  # only `None` in the set
+            return is_null, list(lhs_params)
+        return '(%s OR %s)' % (sql, is_null), list(params) + list(lhs_params)
+
+
+class EnumSetLookup(lookups.Lookup):
+    """
+    Base of the ``EnumSetField`` lookups, comparing the column bitmask with
+    the mask of the given items using a bitwise ``AND``.
+    """
+    template = None
+
+    def get_prep_lookup(self):
+        if hasattr(self.rhs, 'resolve_expression'):
+            return self.rhs
+        return self.lhs.output_field.get_prep_value(self.rhs)
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        masked = connection.ops.combine_expression('&', [lhs_sql, rhs_sql])
+        sql = self.template % {'masked': '({})'.format(masked), 'rhs': rhs_sql}
+        params = list(lhs_params) + list(rhs_params)
+        if '%(rhs)s' in self.template:
+            params.extend(rhs_params)
+        return sql, params
+
+
+class EnumSetHasAll(EnumSetLookup):
+    "``field__has_all=items``: the set contains all the items."
+    lookup_name = 'has_all'
+    template = '%(masked)s = %(rhs)s'
+
+
+class EnumSetHas(EnumSetHasAll):
+    "``field__has=item``: the set contains the item."
+    lookup_name = 'has'
+
+    def get_prep_lookup(self):
+        if not hasattr(self.rhs, 'resolve_expression'):
+            self.rhs = [self.rhs]
+        return super(EnumSetHas, self).get_prep_lookup()
+
+
+class EnumSetHasAny(EnumSetLookup):
+    "``field__has_any=items``: the set contains at least one of the items."
+    lookup_name = 'has_any'
+    template = '%(masked)s <> 0'
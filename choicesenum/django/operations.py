@@ -0,0 +1,139 @@
+# coding: utf-8
+"""
+Migration operations for the enum fields.
+"""
+from __future__ import absolute_import, unicode_literals
+
+from django.db.migrations.operations.base import Operation
+
+
+class CopyEnumField(Operation):
+    """
+    Copies the items of an enum field into another enum field of the same
+    model, with one ``UPDATE`` per item. Used to move a column to another
+    storage, eg. from an ``EnumCharField`` to an ``EnumOrdinalField``::
+
+        operations = [
+            migrations.AddField('event', 'color_code', EnumOrdinalField(enum=Color, null=True)),
+            CopyEnumField('event', 'color', 'color_code'),
+            migrations.RemoveField('event', 'color'),
+            migrations.RenameField('event', 'color_code', 'color'),
+        ]
+
+    Reversing it copies the items back.
+    """
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(self, model_name, from_field, to_field):
+        self.model_name = model_name
+        self.from_field = from_field
+        self.to_field = to_field
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        self._copy(model, self.from_field, self.to_field, schema_editor.connection.alias)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        self._copy(model, self.to_field, self.from_field, schema_editor.connection.alias)
+
+    def _copy(self, model, from_field, to_field, using):
+        if not self.allow_migrate_model(using, model):
+            return
+        manager = model._base_manager.db_manager(using)
+        for member in model._meta.get_field(from_field).enum.options():
+            manager.filter(**{from_field: member}).update(**{to_field: member})
+
+    def describe(self):
+        return 'Copy enum items of {} from {} to {}'.format(
+            self.model_name, self.from_field, self.to_field)
+
+
+def _is_postgres(connection):
+    return connection.vendor == 'postgresql'
+
+
+def _create_type_sql(connection, type_name, values):
+    # Postgres has no `CREATE TYPE IF NOT EXISTS`, an existing type (eg. shared
+    # with another app, or created by hand) is kept by ignoring the error.
+    sql = (
+        'DO $$ BEGIN CREATE TYPE {} AS ENUM ({}); '
+        'EXCEPTION WHEN duplicate_object THEN NULL; END $$'
+    ).format(connection.ops.quote_name(type_name), ', '.join(['%s'] * len(values)))
+    return sql, list(values)
+
+
+def _add_value_sql(connection, type_name, value):
+    sql = 'ALTER TYPE {} ADD VALUE IF NOT EXISTS %s'.format(connection.ops.quote_name(type_name))
+    return sql, [value]
+
+
+class CreateEnumType(Operation):
+    """
+    Creates a Postgres enum type for an ``EnumNativeField``, unless it already
+    exists. A no-op on other databases. The type may be shared or created by
+    hand, so reversing it keeps the type, like ``AddEnumValues``.
+
+    Add it to the migration before the operation adding the field::
+
+        operations = [
+            CreateEnumType('user_status', ['active', 'inactive']),
+            migrations.AddField('user', 'status', EnumNativeField(enum=UserStatus)),
+        ]
+    """
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, name, values):
+        self.name = name
+        self.values = values
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if _is_postgres(schema_editor.connection):
+            schema_editor.execute(
+                *_create_type_sql(schema_editor.connection, self.name, self.values))
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        pass
+
+    def describe(self):
+        return 'Create enum type {}'.format(self.name)
+
+
+class AddEnumValues(Operation):
+    """
+    Adds values to a Postgres enum type, when items are added to the enum.
+    A no-op on other databases. Postgres can't remove enum values, so
+    reversing it does nothing.
+
+    Postgres < 12 doesn't allow adding values inside a transaction, the
+    migration must be declared with ``atomic = False``.
+    """
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, name, values):
+        self.name = name
+        self.values = values
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not _is_postgres(schema_editor.connection):
+            return
+        for value in self.values:
+            schema_editor.execute(*_add_value_sql(schema_editor.connection, self.name, value))
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        pass
+
+    def describe(self):
+        return 'Add values to enum type {}'.format(self.name)
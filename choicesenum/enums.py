@@ -1,36 +1,186 @@
 # coding: utf-8
 from __future__ import absolute_import, unicode_literals
 
+import sys
+from array import array
+from functools import partial
+from itertools import repeat
+from operator import attrgetter, is_
+
 import six
 from enum import Enum, EnumMeta
 
+from . import registry
 
-def is_member_factory(enum_member):
-    "Return a property that checks if the current enum is the expected one"
-    @property
-    def is_member(self):
-        return self == enum_member
-    return is_member
+_MISSING = object()
+_get_ordinal = attrgetter('_ordinal_')
+_ENUM_MISSING_HOOK = getattr(getattr(Enum, '_missing_', None), '__func__', None)
 
+# Bumped by `clear_display_cache()` to discard every cached translated label.
+_display_cache_generation = [0]
 
-class ChoicesMetaClass(EnumMeta):
 
-    def __new__(metacls, cls, bases, classdict):
-        enum_class = EnumMeta.__new__(metacls, cls, bases, classdict)
-        for name, enum_value in enum_class._member_map_.items():
-            prop_name = 'is_{}'.format(name.lower())
-            setattr(enum_class, prop_name, is_member_factory(enum_value))
+def clear_display_cache():
+    """
+    Discard the translated labels cached by ``ChoicesEnum.display``.
+    Call it after reloading translation catalogs.
+    """
+    _display_cache_generation[0] += 1
+
+
+def _lazy_label_types():
+    # A lazy label can only exist if Django was already imported, so there's no
+    # need to import it here.
+    functional = sys.modules.get('django.utils.functional')
+    return (functional.Promise, ) if functional is not None else ()
+
 
+def _get_language():
+    """
+    Return the active Django language, or ``_MISSING`` while translations
+    can't be resolved yet (the app registry isn't ready).
+    """
+    apps = getattr(sys.modules.get('django.apps'), 'apps', None)
+    if apps is None or not apps.ready:
+        return _MISSING
+    from django.utils.translation import get_language
+    return get_language()
+
+
+class ChoicesMetaClass(EnumMeta):
+
+    # When enabled, `choices()`, `values()` and `options()` return new lists
+    # instead of the cached tuples. See `choicesenum.patches.patch_list_choices`.
+    _list_compat_ = False
+
+    def __new__(metacls, cls, bases, classdict, **kwargs):
+        enum_class = EnumMeta.__new__(metacls, cls, bases, classdict, **kwargs)
+        enum_class._options_ = tuple(enum_class)
+        metacls._build_members(enum_class)
+        enum_class._code_typecode_ = metacls._code_typecode(len(enum_class._options_))
+        enum_class._values_ = tuple(x._value_ for x in enum_class._options_)
+        enum_class._choices_ = None  # built on first use, labels may be lazy
+        enum_class._predicates_ = None  # built on first use, see `_get_predicates`
+        registry.add(enum_class)
         return enum_class
 
-    def __contains__(cls, member):
-        if not isinstance(member, cls):
+    @staticmethod
+    def _build_members(enum_class):
+        """
+        Single pass over the members storing their ordinal, hash and label,
+        and building the value -> member index used by lookups. The index is
+        never mutated afterwards. Members with unhashable values can't be dict
+        keys, so they're kept apart.
+        """
+        index = {}
+        unhashable = []
+        lazy_types = _lazy_label_types()
+        for ordinal, member in enumerate(enum_class._options_):
+            value = member._value_
             try:
-                member = cls(member)
-            except Exception:
-                return False
+                member._hash_ = hash(value)
+                index.setdefault(value, member)
+            except TypeError:
+                member._hash_ = None
+                unhashable.append((value, member))
+            member._ordinal_ = ordinal
+            ChoicesMetaClass._build_label(member, lazy_types)
+
+        hook = getattr(enum_class, '_missing_', None)
+        enum_class._value_index_ = index
+        enum_class._unhashable_members_ = tuple(unhashable)
+        enum_class._has_missing_hook_ = \
+            getattr(hook, '__func__', hook) is not _ENUM_MISSING_HOOK
 
-        return member._name_ in cls._member_map_
+    @staticmethod
+    def _code_typecode(size):
+        "Smallest unsigned `array` typecode able to hold `size` ordinals."
+        if size <= 0x100:
+            return 'B'
+        return 'H' if size <= 0x10000 else 'L'
+
+    @staticmethod
+    def _build_label(member, lazy_types):
+        """
+        Store the member label, falling back to one derived from the name.
+        """
+        label = member._display_
+        if label is None:
+            label = member._name_.replace('_', ' ').capitalize()
+        member._label_ = label
+        if isinstance(label, lazy_types):
+            member._lazy_label_ = True
+            member._display_cache_ = (None, {})
+
+    def _get_predicates(cls):
+        """
+        The ``is_<name>`` -> member table used by ``ChoicesEnum.__getattr__``,
+        built on first use so large enums don't pay for it at import time.
+        """
+        if cls._predicates_ is None:
+            cls._predicates_ = dict(
+                ('is_{}'.format(name.lower()), member)
+                for name, member in cls._member_map_.items()
+            )
+        return cls._predicates_
+
+    def __call__(cls, value, names=None, *args, **kwargs):
+        if names is None:
+            member = cls._find_member(value)
+            if member is not _MISSING:
+                return member
+            # `names` is left out: Python 3.12+ takes an explicit `None` for part of the value
+            return EnumMeta.__call__(cls, value, *args, **kwargs)
+        if not args and kwargs.get('module') is None:
+            # the functional API looks up the module of its caller, which is us
+            kwargs['module'] = sys._getframe(1).f_globals.get('__name__')
+        return EnumMeta.__call__(cls, value, names, *args, **kwargs)
+
+    def __contains__(cls, member):
+        return cls._get_member(member, _MISSING) is not _MISSING
+
+    def _find_member(cls, value):
+        """
+        Return the member holding ``value`` or ``_MISSING``, without raising.
+        """
+        try:
+            return cls._value_index_.get(value, _MISSING)
+        except TypeError:  # unhashable values can't be dict keys
+            for member_value, member in cls._unhashable_members_:
+                if member_value == value:
+                    return member
+            return _MISSING
+
+    def _get_member(cls, value, default=None):
+        """
+        Like ``_find_member``, but honoring custom ``_missing_`` hooks.
+        """
+        member = cls._find_member(value)
+        if member is not _MISSING:
+            return member
+        if not cls._has_missing_hook_:
+            return default
+        try:
+            return EnumMeta.__call__(cls, value)
+        except Exception:
+            return default
+
+    def _get_members(cls, values):
+        """
+        Bulk version of ``_get_member``: a list of members for a list of
+        values, with ``_MISSING`` for the invalid ones.
+        """
+        try:
+            members = list(six.moves.map(cls._value_index_.get, values, repeat(_MISSING)))
+        except TypeError:  # an unhashable value, go one by one
+            members = [cls._find_member(value) for value in values]
+
+        if cls._has_missing_hook_:
+            members = [
+                cls._get_member(value, _MISSING) if member is _MISSING else member
+                for value, member in zip(values, members)
+            ]
+        return members
 
 
 class ChoicesEnum(six.with_metaclass(ChoicesMetaClass, Enum)):
@@ -53,6 +203,22 @@ class ChoicesEnum(six.with_metaclass(ChoicesMetaClass, Enum)):
     def __repr__(self):
         return "%s(%r).%s" % (self.__class__.__name__, self._value_, self._name_, )
 
+    def __getattr__(self, name):
+        # Only called when regular lookup fails, so custom attributes take
+        # precedence over the `is_<name>` predicates.
+        cls = self.__class__
+        member = cls._get_predicates().get(name, _MISSING)
+        if member is _MISSING:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                cls.__name__, name))
+        # Cached as a property on first use, so the next reads skip this method.
+        setattr(cls, name, property(partial(is_, member)))
+        return self is member
+
+    def __dir__(self):
+        predicates = self.__class__._get_predicates()
+        return sorted(set(super(ChoicesEnum, self).__dir__()) | set(predicates))
+
     @staticmethod
     def _get_value(item):
         return getattr(item, 'value', item)
@@ -64,25 +230,42 @@ class ChoicesEnum(six.with_metaclass(ChoicesMetaClass, Enum)):
             return 1
 
     def __hash__(self):
-        return hash(self.value)
+        if self._hash_ is None:  # unhashable value, let it raise
+            return hash(self._value_)
+        return self._hash_
+
+    # Comparisons read `_value_` directly and short-circuit on identity and on
+    # items of the same enum. Anything else is compared by its `value`, if any.
 
     def __lt__(self, other):
-        return self.value < self._get_value(other)
+        if other.__class__ is self.__class__:
+            return self._value_ < other._value_
+        return self._value_ < getattr(other, 'value', other)
 
     def __le__(self, other):
-        return self.value <= self._get_value(other)
+        if other.__class__ is self.__class__:
+            return self._value_ <= other._value_
+        return self._value_ <= getattr(other, 'value', other)
 
     def __eq__(self, other):
-        return self.value == self._get_value(other)
+        if self is other:
+            return True
+        if other.__class__ is self.__class__:
+            return False  # items of the same enum are equal only to themselves
+        return self._value_ == getattr(other, 'value', other)
 
     def __ne__(self, other):
-        return not self == other
+        return not self.__eq__(other)
 
     def __gt__(self, other):
-        return self.value > self._get_value(other)
+        if other.__class__ is self.__class__:
+            return self._value_ > other._value_
+        return self._value_ > getattr(other, 'value', other)
 
     def __ge__(self, other):
-        return self.value >= self._get_value(other)
+        if other.__class__ is self.__class__:
+            return self._value_ >= other._value_
+        return self._value_ >= getattr(other, 'value', other)
 
     def __json__(self):
         """
@@ -104,8 +287,32 @@ class ChoicesEnum(six.with_metaclass(ChoicesMetaClass, Enum)):
 
     @property
     def display(self):
-        return self._display_ if self._display_ is not None else \
-            self._name_.replace('_', ' ').capitalize()
+        if self._lazy_label_:
+            return self._translated_label()
+        return self._label_
+
+    def _translated_label(self):
+        """
+        Resolve a lazy label, caching the result per active language.
+        """
+        language = _get_language()
+        if language is _MISSING:
+            return self._label_
+
+        generation, cache = self._display_cache_
+        if generation != _display_cache_generation[0]:
+            cache = {}
+            self._display_cache_ = (_display_cache_generation[0], cache)
+        if language not in cache:
+            cache[language] = six.text_type(self._label_)
+        return cache[language]
+
+    @property
+    def ordinal(self):
+        """
+        Dense position (0, 1, 2...) of the item in the enum definition order.
+        """
+        return self._ordinal_
 
     @property
     def description(self):
@@ -115,31 +322,138 @@ class ChoicesEnum(six.with_metaclass(ChoicesMetaClass, Enum)):
         """
         return self.display
 
+    @classmethod
+    def _as_result(cls, items):
+        return list(items) if cls._list_compat_ else items
+
     @classmethod
     def choices(cls):
         """
+        Returns a tuple of ``(item, display)`` pairs, computed once per class.
+
         Args:
             cls (Enum): Enum class.
         """
-        return [(x, x.display) for x in cls]
+        if cls._choices_ is None:
+            # lazy labels are kept as is, to be resolved by whoever renders them
+            cls._choices_ = tuple(
+                (x, x._label_ if x._lazy_label_ else x.display) for x in cls._options_)
+        return cls._as_result(cls._choices_)
 
     @classmethod
     def values(cls):
         """
+        Returns a tuple of the inner values, computed once per class.
+
+        Args:
+            cls (Enum): Enum class.
+        """
+        return cls._as_result(cls._values_)
+
+    @classmethod
+    def from_values(cls, values, errors='strict', default=None):
+        """
+        Bulk ``.get()``: converts many values (or items) to enum items at once.
+
         Args:
             cls (Enum): Enum class.
+            values: Any iterable, including ``array.array`` and NumPy arrays.
+            errors: How to handle values that are not an item of enum:
+                ``'strict'`` raises ``ValueError``, ``'default'`` replaces them by
+                ``default`` and ``'mask'`` also returns a list of booleans
+                flagging them.
+            default: Value to use for invalid values. Default is None.
+
+        Returns:
+            A list of items, or a ``(items, mask)`` tuple for ``errors='mask'``.
         """
-        return [x.value for x in cls]
+        if errors not in ('strict', 'default', 'mask'):
+            raise ValueError('Invalid errors mode: {!r}'.format(errors))
+
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+        members = cls._get_members(values)
+        invalid = [member is _MISSING for member in members]
+        if True in invalid:
+            if errors == 'strict':
+                raise ValueError('%r is not a valid %s' % (
+                    values[invalid.index(True)], cls.__name__))
+            members = [default if member is _MISSING else member for member in members]
+
+        return (members, invalid) if errors == 'mask' else members
+
+    @classmethod
+    def to_values(cls, values, errors='strict', default=None):
+        """
+        Like ``from_values``, but returns the inner values of the items.
+        Invalid values are replaced by ``default`` itself.
+        """
+        result = cls.from_values(values, errors=errors, default=_MISSING)
+        members, invalid = result if errors == 'mask' else (result, None)
+        values = [default if x is _MISSING else x._value_ for x in members]
+        return (values, invalid) if errors == 'mask' else values
 
     @classmethod
     def options(cls):
         """
-        Converts the enum options to a list.
+        Returns the enum options as a tuple, computed once per class.
+
+        Args:
+            cls (Enum): Enum class.
+        """
+        return cls._as_result(cls._options_)
+
+    @classmethod
+    def encode(cls, values, as_numpy=False):
+        """
+        Converts many values (or items) to their ordinals, using the smallest
+        unsigned integer type able to hold them (1 byte for up to 256 items).
+
+        Args:
+            cls (Enum): Enum class.
+            values: Any iterable of values or items, all valid.
+            as_numpy: Return a NumPy array instead of an ``array.array``.
+        """
+        codes = array(cls._code_typecode_, six.moves.map(_get_ordinal, cls.from_values(values)))
+        if as_numpy:
+            import numpy
+            return numpy.frombuffer(codes, dtype=codes.typecode)
+        return codes
+
+    @classmethod
+    def decode(cls, codes):
+        """
+        Converts many ordinals (eg. the result of ``encode``) back to items.
 
         Args:
             cls (Enum): Enum class.
+            codes: Any iterable of ordinals, including arrays and NumPy arrays.
         """
-        return list(cls)
+        codes = codes.tolist() if hasattr(codes, 'tolist') else list(codes)
+        if codes and not 0 <= min(codes) <= max(codes) < len(cls._options_):
+            raise ValueError('Invalid ordinals for {}'.format(cls.__name__))
+        return list(six.moves.map(cls._options_.__getitem__, codes))
+
+    @classmethod
+    def from_table(cls, name, rows, module=None):
+        """
+        Builds a new enum class from reference data in a single call, eg. for
+        generated enums with thousands of items.
+
+        Args:
+            cls (Enum): Base enum class, can be a ``ChoicesEnum`` subclass
+                without items to share methods and properties.
+            name: Name of the new class.
+            rows: A ``{name: value}`` mapping or an iterable of
+                ``(name, value)`` or ``(name, value, display)`` rows.
+            module: Module of the new class, needed for pickling. Defaults
+                to the module of the caller.
+        """
+        if hasattr(rows, 'items'):
+            rows = rows.items()
+        names = [(row[0], row[1] if len(row) == 2 else tuple(row[1:])) for row in rows]
+        if module is None:
+            module = sys._getframe(1).f_globals.get('__name__')
+        return cls(name, names, module=module)
 
     @classmethod
     def get(cls, value, default=None):
@@ -151,11 +465,12 @@ class ChoicesEnum(six.with_metaclass(ChoicesMetaClass, Enum)):
             value: Value to get inside Enum.
             default: Value to return in case of error. Default is None.
         """
-        try:
-            return cls(value)
-        except Exception:
-            return default
+        return cls._get_member(value, default)
 
     @classmethod
     def _import_path(cls):
         return '{}.{}'.format(cls.__module__, cls.__name__)
+
+
+# Only members with lazy labels override it, saving an attribute per member.
+ChoicesEnum._lazy_label_ = False
@@ -1,3 +1,7 @@
+# coding: utf-8
+from __future__ import absolute_import, unicode_literals
+
+from contextlib import contextmanager
 
 
 def patch_json():
@@ -5,11 +9,45 @@ def patch_json():
     Patch json default encoder to globally try to find and call a ``__json__``
     method inside classes before raising "TypeError: Object of type 'X' is not
     JSON serializable"
+
+    Prefer ``choicesenum.serialization.json_default`` or ``patched_json``, which
+    don't change the encoding for other libraries.
     """
     from json import JSONEncoder
+    from .serialization import _json_converter, _json_converters, _not_serializable
 
     def _default(self, obj):
-        return getattr(obj.__class__, "__json__", _default.default)(obj)
+        converter = _json_converters.get(obj.__class__) or _json_converter(obj.__class__)
+        if converter is _not_serializable:
+            return _default.default(self, obj)  # eg. installed by another library
+        return converter(obj)
 
-    _default.default = JSONEncoder().default
+    _default.default = JSONEncoder.default
     JSONEncoder.default = _default
+
+
+@contextmanager
+def patched_json():
+    """
+    Context manager version of ``patch_json``, restoring the previous
+    ``JSONEncoder.default`` on exit.
+    """
+    from json import JSONEncoder
+
+    default = JSONEncoder.default
+    patch_json()
+    try:
+        yield
+    finally:
+        JSONEncoder.default = default
+
+
+def patch_list_choices(enabled=True):
+    """
+    Compatibility mode: make ``choices()``, ``values()`` and ``options()``
+    return new lists on each call (as in choicesenum <= 0.7) instead of the
+    cached tuples.
+    """
+    from .enums import ChoicesMetaClass
+
+    ChoicesMetaClass._list_compat_ = enabled
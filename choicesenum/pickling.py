@@ -0,0 +1,71 @@
+# coding: utf-8
+"""
+Compact pickling of ``ChoicesEnum`` items, as an enum id and the item
+ordinal instead of the enum import path and the item value.
+
+The ids are the short ids of ``choicesenum.registry``, and must be the same
+in the processes that load the pickles (eg. set by the module defining the
+enums). The loader is referenced through a ``copyreg`` extension code, two
+bytes instead of its import path with pickle protocols 2+.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import pickle
+from itertools import count
+
+from six.moves import copyreg
+
+from . import registry
+
+# Extension code of the loader, in the range `copyreg` leaves to third parties
+# (192-239). Change it before enabling compact pickles if it's taken.
+EXTENSION_CODE = 214
+
+_sequence = count()
+
+
+def _next_id():
+    for class_id in _sequence:
+        if registry.get_by_id(class_id) is None:
+            return class_id
+
+
+def register(enum, class_id=None):
+    """
+    Registers the enum under ``class_id`` and returns the id. Default ids are
+    small ints in the order of registration, so register the enums in the
+    same order in every process, or give explicit ids.
+    See ``choicesenum.registry.set_id``.
+    """
+    copyreg.add_extension(__name__, '_load_member', EXTENSION_CODE)  # no-op if already added
+    return registry.set_id(enum, _next_id() if class_id is None else class_id)
+
+
+def _load_member(class_id, ordinal):
+    enum = registry.get_by_id(class_id)
+    if enum is None:
+        raise pickle.UnpicklingError(
+            'Unknown enum id {}, its module must be imported first'.format(class_id))
+    return enum._options_[ordinal]
+
+
+def _reduce_member(member):
+    return _load_member, (registry.id_of(member.__class__), member._ordinal_)
+
+
+def enable_compact_pickle(*enums):
+    """
+    Makes ``pickle`` use the compact form for the items of the enums, through
+    ``copyreg``. Enums without an id yet are registered with the next
+    sequential id.
+    """
+    for enum in enums:
+        if registry.id_of(enum) is None:
+            register(enum)
+        copyreg.pickle(enum, _reduce_member)
+
+
+def disable_compact_pickle(*enums):
+    "Restores the default pickling of the items of the enums."
+    for enum in enums:
+        copyreg.dispatch_table.pop(enum, None)
@@ -0,0 +1,84 @@
+# coding: utf-8
+"""
+Process-wide registry of the ``ChoicesEnum`` classes, filled as they are
+defined, to resolve them by import path (or by a short id) without going
+through ``importlib``.
+
+Only enums with items are registered. Classes are held by weak references,
+so enums defined on the fly (eg. in tests) don't leak; redefining an enum
+under the same import path replaces the previous entry.
+"""
+from __future__ import absolute_import, unicode_literals
+
+from importlib import import_module
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+_enums_by_path = WeakValueDictionary()
+_enums_by_id = WeakValueDictionary()
+_ids = WeakKeyDictionary()
+
+
+def add(enum):
+    "Registers the enum under its import path. Called by ``ChoicesMetaClass``."
+    if enum._options_:
+        _enums_by_path[enum._import_path()] = enum
+
+
+def get(path, default=None):
+    "Returns the registered enum with the import path, or ``default``."
+    return _enums_by_path.get(path, default)
+
+
+def resolve(path):
+    """
+    Returns the enum with the import path, importing it when it isn't
+    registered (eg. its module wasn't imported yet, or it's re-exported
+    under another path). Raises ``ImportError`` if it can't be found.
+    """
+    enum = _enums_by_path.get(path)
+    if enum is not None:
+        return enum
+    module_path, _, name = path.rpartition('.')
+    try:
+        return getattr(import_module(module_path), name)
+    except (AttributeError, ValueError):
+        raise ImportError('{!r} is not a valid enum path'.format(path))
+
+
+def set_id(enum, short_id):
+    """
+    Registers the enum under a short id (eg. a small int for compact
+    payloads). Raises ``ValueError`` if the id is used by another enum.
+    """
+    other = _enums_by_id.get(short_id, enum)
+    if other._import_path() != enum._import_path():
+        raise ValueError('Enum id {!r} of {} is already used by {}'.format(
+            short_id, enum._import_path(), other._import_path()))
+    _enums_by_id[short_id] = enum
+    _ids[enum] = short_id
+    return short_id
+
+
+def get_by_id(short_id, default=None):
+    "Returns the enum with the short id, or ``default``."
+    return _enums_by_id.get(short_id, default)
+
+
+def id_of(enum, default=None):
+    "Returns the short id of the enum, or ``default``."
+    return _ids.get(enum, default)
+
+
+def remove_id(enum):
+    "Unregisters the short id of the enum, if any."
+    short_id = _ids.pop(enum, None)
+    if short_id is not None and _enums_by_id.get(short_id) is enum:
+        del _enums_by_id[short_id]
+
+
+def registered():
+    """
+    List of ``(import_path, number of items)`` of the registered enums,
+    sorted by path. Meant for instrumentation.
+    """
+    return sorted((path, len(enum._options_)) for path, enum in _enums_by_path.items())
@@ -2,7 +2,8 @@
 from __future__ import absolute_import, unicode_literals
 
 from choicesenum import ChoicesEnum
-from schematics.types import BaseType
+from choicesenum.enums import _MISSING
+from schematics.types import BaseType, ListType
 from schematics.exceptions import ValidationError
 
 
@@ -14,10 +15,37 @@ class ChoicesEnumType(BaseType):
         self.type = type_
 
     def to_native(self, value, context=None):
-        return self.type(value)
+        if value.__class__ is self.type:
+            return value
+        member = self.type._get_member(value, _MISSING)
+        if member is _MISSING:
+            return self.type(value)  # ValueError
+        return member
 
     def to_primitive(self, value, context=None):
-        return self.type(value).value
+        if value.__class__ is not self.type:
+            value = self.to_native(value)
+        return value._value_
 
     class Messages:
         INVALID_TYPE = 'Expected a ChoicesEnum sub type'
+
+
+class ChoicesEnumListType(ListType):
+    """
+    A list of ``ChoicesEnum`` items, eg. ``ChoicesEnumListType(UserStatus)``.
+
+    Lists are converted with a single lookup of all values in the enum. Lists
+    with invalid values or ``None``, and validation, take the item by item
+    path of ``ListType``.
+    """
+
+    def __init__(self, type_, **kwargs):
+        super(ChoicesEnumListType, self).__init__(ChoicesEnumType(type_), **kwargs)
+
+    def _convert(self, value, context):
+        values = list(self._coerce(value))
+        members = self.field.type._get_members(values)
+        if getattr(context, 'validate', False) or None in values or _MISSING in members:
+            return super(ChoicesEnumListType, self)._convert(values, context)
+        return members
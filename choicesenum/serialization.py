@@ -0,0 +1,109 @@
+# coding: utf-8
+"""
+JSON serialization of ``ChoicesEnum`` items and ``ChoicesEnumSet``, without
+patching the stdlib encoder.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import json
+from itertools import islice
+from operator import attrgetter
+
+import six
+
+from .enums import ChoicesEnum
+from .sets import ChoicesEnumSet
+
+_get_value = attrgetter('_value_')
+
+# class -> function returning the JSON form of its instances. Filled on the
+# first instance of each class, so the next ones take a single dict lookup.
+# Classes that can't be serialized aren't kept.
+_json_converters = {
+    ChoicesEnumSet: ChoicesEnumSet.values,
+}
+
+
+def _not_serializable(obj):
+    raise TypeError('Object of type {} is not JSON serializable'.format(obj.__class__.__name__))
+
+
+def _json_converter(cls):
+    converter = getattr(cls, '__json__', _not_serializable)
+    if converter is _not_serializable:
+        return converter
+    if issubclass(cls, ChoicesEnum) and converter == ChoicesEnum.__json__:
+        converter = _get_value  # not overridden
+    _json_converters[cls] = converter
+    return converter
+
+
+def json_default(obj):
+    """
+    ``default`` hook for ``json.dumps`` and compatible libraries (``orjson``,
+    ``ujson``, ``simplejson``): items are converted to their values, sets to
+    lists of values, and other objects with a ``__json__`` method call it::
+
+        json.dumps(data, default=json_default)
+        orjson.dumps(data, default=json_default)
+    """
+    try:
+        converter = _json_converters[obj.__class__]
+    except KeyError:
+        converter = _json_converter(obj.__class__)
+    return converter(obj)
+
+
+class ChoicesJSONEncoder(json.JSONEncoder):
+    """
+    A ``JSONEncoder`` using ``json_default``, eg. ``json.dumps(data, cls=ChoicesJSONEncoder)``.
+    """
+
+    def default(self, obj):
+        return json_default(obj)
+
+
+def _with_display(record):
+    flat = {}
+    for key, value in record.items():
+        flat[key] = value
+        if isinstance(value, ChoicesEnum):
+            flat[key + '_display'] = six.text_type(value.display)
+    return flat
+
+
+def iter_ndjson(records, display=False, **kwargs):
+    """
+    Yields one JSON line (without the line break) for each record, a mapping
+    or any object ``json_default`` accepts. Items are encoded as their values,
+    and with ``display=True`` the labels of the items in the mappings are
+    added as ``<key>_display``.
+
+    ``kwargs`` are passed to ``json.JSONEncoder``.
+    """
+    kwargs.setdefault('default', json_default)
+    encode = json.JSONEncoder(**kwargs).encode
+    if display:
+        records = (
+            _with_display(record) if isinstance(record, dict) else record
+            for record in records
+        )
+    for record in records:
+        yield encode(record)
+
+
+def write_ndjson(records, stream, display=False, chunk_size=1000, **kwargs):
+    """
+    Writes the records to the text ``stream`` as newline delimited JSON, in
+    chunks of ``chunk_size`` lines. Records are consumed lazily, so memory
+    use doesn't depend on their number. Returns the number of records
+    written. See ``iter_ndjson`` for the other arguments.
+    """
+    lines = iter_ndjson(records, display=display, **kwargs)
+    count = 0
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return count
+        stream.write('\n'.join(chunk) + '\n')
+        count += len(chunk)
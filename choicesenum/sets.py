@@ -0,0 +1,184 @@
+# coding: utf-8
+from __future__ import absolute_import, unicode_literals
+
+from six.moves.collections_abc import MutableSet
+
+from .enums import _MISSING
+
+
+def _popcount(mask):
+    return bin(mask).count('1')
+
+
+class ChoicesEnumSet(MutableSet):
+    """
+    A mutable set of items of a single ``ChoicesEnum``, stored as an int
+    bitmask over the item ordinals.
+
+    Membership accepts items and raw values, like ``value in Enum``.
+    """
+    __slots__ = ('enum', '_mask', )
+    __hash__ = None
+
+    def __init__(self, enum, items=()):
+        self.enum = enum
+        self._mask = self._mask_of(items)
+
+    @classmethod
+    def from_mask(cls, enum, mask):
+        """
+        Builds a set from a bitmask, eg. the result of ``.mask``.
+        """
+        if not 0 <= mask < 1 << len(enum._options_):
+            raise ValueError('Invalid mask for {}: {!r}'.format(enum.__name__, mask))
+        instance = cls(enum)
+        instance._mask = mask
+        return instance
+
+    @property
+    def mask(self):
+        return self._mask
+
+    def _mask_of(self, items):
+        if isinstance(items, ChoicesEnumSet) and items.enum is self.enum:
+            return items._mask
+        mask = 0
+        for member in self.enum.from_values(items):
+            mask |= 1 << member._ordinal_
+        return mask
+
+    def _same_enum(self, other):
+        return isinstance(other, ChoicesEnumSet) and other.enum is self.enum
+
+    def _new(self, mask):
+        return self.from_mask(self.enum, mask)
+
+    def _from_iterable(self, iterable):
+        # Used by the `Set` mixin methods when the other operand isn't a
+        # ChoicesEnumSet of the same enum.
+        return self.__class__(self.enum, iterable)
+
+    def __contains__(self, item):
+        member = self.enum._get_member(item, _MISSING)
+        return member is not _MISSING and bool(self._mask >> member._ordinal_ & 1)
+
+    def __iter__(self):
+        mask = self._mask
+        options = self.enum._options_
+        while mask:
+            lowest = mask & -mask
+            yield options[lowest.bit_length() - 1]
+            mask ^= lowest
+
+    def __len__(self):
+        return _popcount(self._mask)
+
+    def add(self, item):
+        self._mask |= 1 << self.enum(item)._ordinal_
+
+    def discard(self, item):
+        member = self.enum._get_member(item, _MISSING)
+        if member is not _MISSING:
+            self._mask &= ~(1 << member._ordinal_)
+
+    def clear(self):
+        self._mask = 0
+
+    def copy(self):
+        return self._new(self._mask)
+
+    def union(self, *others):
+        mask = self._mask
+        for other in others:
+            mask |= self._mask_of(other)
+        return self._new(mask)
+
+    def intersection(self, *others):
+        mask = self._mask
+        for other in others:
+            mask &= self._mask_of(other)
+        return self._new(mask)
+
+    def difference(self, *others):
+        mask = self._mask
+        for other in others:
+            mask &= ~self._mask_of(other)
+        return self._new(mask)
+
+    def symmetric_difference(self, other):
+        return self._new(self._mask ^ self._mask_of(other))
+
+    def __or__(self, other):
+        if self._same_enum(other):
+            return self._new(self._mask | other._mask)
+        return super(ChoicesEnumSet, self).__or__(other)
+
+    def __and__(self, other):
+        if self._same_enum(other):
+            return self._new(self._mask & other._mask)
+        return super(ChoicesEnumSet, self).__and__(other)
+
+    def __sub__(self, other):
+        if self._same_enum(other):
+            return self._new(self._mask & ~other._mask)
+        return super(ChoicesEnumSet, self).__sub__(other)
+
+    def __xor__(self, other):
+        if self._same_enum(other):
+            return self._new(self._mask ^ other._mask)
+        return super(ChoicesEnumSet, self).__xor__(other)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __ior__(self, other):
+        self._mask |= self._mask_of(other)
+        return self
+
+    def __iand__(self, other):
+        self._mask &= self._mask_of(other)
+        return self
+
+    def __isub__(self, other):
+        self._mask &= ~self._mask_of(other)
+        return self
+
+    def __ixor__(self, other):
+        self._mask ^= self._mask_of(other)
+        return self
+
+    def __eq__(self, other):
+        if self._same_enum(other):
+            return self._mask == other._mask
+        return super(ChoicesEnumSet, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __le__(self, other):
+        if self._same_enum(other):
+            return self._mask & ~other._mask == 0
+        return super(ChoicesEnumSet, self).__le__(other)
+
+    def __ge__(self, other):
+        if self._same_enum(other):
+            return other._mask & ~self._mask == 0
+        return super(ChoicesEnumSet, self).__ge__(other)
+
+    def __repr__(self):
+        return '{}({}, {!r})'.format(self.__class__.__name__, self.enum.__name__, list(self))
+
+    def __reduce__(self):
+        # Values are used instead of the mask, ordinals may change between versions.
+        return self.__class__, (self.enum, self.values())
+
+    def values(self):
+        "List of the inner values of the items, in definition order."
+        return [member._value_ for member in self]
+
+    def __json__(self):
+        """
+        JSON form: the list of inner values. See ``choicesenum.patches.patch_json``.
+        """
+        return self.values()
@@ -0,0 +1,18 @@
+# coding: utf-8
+"""
+An enum module importing the models that refer to it, only possible
+because the fields resolve the enum path lazily.
+"""
+from __future__ import absolute_import, unicode_literals
+
+from choicesenum import ChoicesEnum
+
+from .models import Palette
+
+
+class Shade(ChoicesEnum):
+    LIGHT = 'light'
+    DARK = 'dark'
+
+    def palettes(self):
+        return Palette.objects.filter(shade=self)
@@ -2,9 +2,11 @@
 from __future__ import absolute_import, unicode_literals
 
 from django.db import models
-from choicesenum.django.fields import EnumCharField, EnumIntegerField
+from choicesenum.django.fields import (
+    EnumCharField, EnumIntegerField, EnumNativeField, EnumOrdinalField, EnumSetField,
+)
 
-from .enums import Color, UserStatus
+from .enums import Color, Sizes, UserStatus
 
 
 class ColorModel(models.Model):
@@ -26,3 +28,28 @@ class Preference(models.Model):
         null=True,
         on_delete=models.CASCADE,
     )
+
+
+class Palette(models.Model):
+    color = EnumCharField(max_length=7, enum=Color, default=Color.RED, check_constraint=True)
+    color_code = EnumOrdinalField(enum=Color, default=Color.RED)
+    status = EnumOrdinalField(enum=UserStatus, null=True, codes={1: 10, 2: 20, 3: 30, 4: 40},
+                              check_constraint=True)
+    size = EnumNativeField(enum=Sizes, null=True)
+    shade = EnumCharField(max_length=5, enum='tests.app.lazy_enums.Shade', default='light')
+
+
+class AbstractTagged(models.Model):
+    color = EnumCharField(max_length=7, enum=Color, default=Color.RED, check_constraint=True)
+
+    class Meta:
+        abstract = True
+
+
+class Tag(AbstractTagged):
+    pass
+
+
+class Swatch(models.Model):
+    colors = EnumSetField(enum=Color)
+    sizes = EnumSetField(enum=Sizes, null=True)
@@ -2,8 +2,10 @@
 from __future__ import absolute_import, unicode_literals
 
 import sys
+import array
 import operator
 
+import mock
 import pytest
 import pickle
 
@@ -307,3 +309,297 @@ def test_should_support_membership_vertification(colors):
     assert colors.RED in colors
     assert colors.RED.value in colors
     assert 'non-existent-color' not in colors
+
+
+def test_get_should_not_raise_on_missing_values(colors):
+    with mock.patch('choicesenum.enums.EnumMeta.__call__') as m:
+        assert colors.get('undefined_color') is None
+        assert 'undefined_color' not in colors
+        assert colors.get('#f00') is colors.RED
+        assert colors('#f00') is colors.RED
+    assert not m.called
+
+
+@pytest.mark.parametrize('value', [['#f00'], {'color': '#f00'}])
+def test_unhashable_values_should_be_missing(colors, value):
+    assert colors.get(value) is None
+    assert value not in colors
+    with pytest.raises(ValueError):
+        colors(value)
+
+
+def test_unhashable_member_values_should_be_found():
+    from choicesenum import ChoicesEnum
+
+    class Coords(ChoicesEnum):
+        ORIGIN = [0, 0]
+        UNIT = [1, 1]
+
+    assert Coords([1, 1]) is Coords.UNIT
+    assert Coords.get([0, 0]) is Coords.ORIGIN
+    assert [0, 0] in Coords
+    assert [2, 2] not in Coords
+
+
+def test_lookups_should_honor_custom_missing_hook():
+    from choicesenum import ChoicesEnum
+
+    class Answer(ChoicesEnum):
+        YES = 'y'
+        NO = 'n'
+
+        @classmethod
+        def _missing_(cls, value):
+            return cls.get(str(value).lower()[:1])
+
+    assert Answer('YES') is Answer.YES
+    assert Answer.get('No') is Answer.NO
+    assert 'Nope' in Answer
+    assert Answer.get('maybe') is None
+
+
+def test_call_should_raise_value_error_for_missing_values(colors):
+    with pytest.raises(ValueError) as excinfo:
+        colors('missing')
+
+    assert str(excinfo.value) == "'missing' is not a valid Color"
+
+
+@pytest.mark.parametrize('method', ['choices', 'values', 'options'])
+def test_choices_values_and_options_should_be_cached_tuples(colors, method):
+    result = getattr(colors, method)()
+
+    assert isinstance(result, tuple)
+    assert getattr(colors, method)() is result
+
+
+@pytest.mark.parametrize('method', ['choices', 'values', 'options'])
+def test_patch_list_choices_should_return_new_lists(colors, method):
+    from choicesenum.patches import patch_list_choices
+
+    patch_list_choices()
+    try:
+        result = getattr(colors, method)()
+        assert isinstance(result, list)
+        assert getattr(colors, method)() is not result
+        assert result == list(getattr(colors, '_{}_'.format(method)))
+    finally:
+        patch_list_choices(False)
+
+
+def test_functional_api_should_create_choices_enums():
+    from choicesenum import ChoicesEnum
+
+    Level = ChoicesEnum('Level', [('LOW', 1), ('HIGH', (2, 'Very high'))])
+
+    assert Level(1) is Level.LOW
+    assert Level.HIGH.display == 'Very high'
+    assert Level.values() == (1, 2)
+    assert Level.__module__ == __name__
+
+
+def test_fallback_display_should_be_computed_once(http_statuses):
+    assert http_statuses.BAD_REQUEST.display is http_statuses.BAD_REQUEST.display
+    assert http_statuses.BAD_REQUEST._label_ == 'Bad request'
+
+
+@pytest.mark.parametrize('values', [
+    [200, 401, 200],
+    (x for x in [200, 401, 200]),
+    array.array('i', [200, 401, 200]),
+])
+def test_from_values_should_convert_iterables(http_statuses, values):
+    expected = [http_statuses.OK, http_statuses.UNAUTHORIZED, http_statuses.OK]
+    assert http_statuses.from_values(values) == expected
+
+
+def test_from_values_should_convert_numpy_arrays(http_statuses):
+    numpy = pytest.importorskip('numpy')
+    values = numpy.array([400, 403])
+    assert http_statuses.from_values(values) == [
+        http_statuses.BAD_REQUEST, http_statuses.FORBIDDEN]
+    assert http_statuses.to_values(values) == [400, 403]
+
+
+def test_from_values_should_raise_on_invalid_values_by_default(colors):
+    with pytest.raises(ValueError) as excinfo:
+        colors.from_values(['#f00', 'missing', ['unhashable']])
+    assert str(excinfo.value) == "'missing' is not a valid Color"
+
+
+def test_from_values_should_fill_invalid_values_with_default(colors):
+    result = colors.from_values(['#f00', 'missing', ['unhashable']], errors='default')
+    assert result == [colors.RED, None, None]
+
+    result = colors.from_values(['missing', colors.BLUE], errors='default', default=colors.GREEN)
+    assert result == [colors.GREEN, colors.BLUE]
+
+
+def test_from_values_should_mask_invalid_values(colors):
+    members, mask = colors.from_values(['#f00', 'missing'], errors='mask')
+    assert members == [colors.RED, None]
+    assert mask == [False, True]
+
+
+def test_from_values_should_reject_unknown_errors_mode(colors):
+    with pytest.raises(ValueError):
+        colors.from_values([], errors='ignore')
+
+
+def test_to_values_should_return_inner_values(colors):
+    assert colors.to_values([colors.RED, '#0f0']) == ['#f00', '#0f0']
+    assert colors.to_values(['#f00', 'x'], errors='default', default='') == ['#f00', '']
+    assert colors.to_values(['x', '#f00'], errors='mask') == (
+        [None, '#f00'], [True, False])
+
+
+def test_ordinal_should_follow_definition_order(colors):
+    assert [x.ordinal for x in colors] == [0, 1, 2]
+
+
+def test_encode_should_return_compact_ordinals(colors):
+    codes = colors.encode(['#00f', colors.RED, colors.BLUE])
+
+    assert codes == array.array('B', [2, 0, 2])
+    assert colors.decode(codes) == [colors.BLUE, colors.RED, colors.BLUE]
+
+
+def test_encode_should_use_wider_codes_for_large_enums():
+    from choicesenum import ChoicesEnum
+
+    Big = ChoicesEnum('Big', [('ITEM_{}'.format(i), i) for i in range(300)])
+
+    codes = Big.encode([Big.ITEM_299, 0])
+    assert codes.typecode == 'H'
+    assert list(codes) == [299, 0]
+
+
+def test_encode_and_decode_should_support_numpy(colors):
+    numpy = pytest.importorskip('numpy')
+    codes = colors.encode(['#0f0', '#f00'], as_numpy=True)
+
+    assert codes.dtype == numpy.uint8
+    assert colors.decode(codes) == [colors.GREEN, colors.RED]
+
+
+def test_encode_should_raise_on_invalid_values(colors):
+    with pytest.raises(ValueError):
+        colors.encode(['#f00', 'missing'])
+
+
+@pytest.mark.parametrize('codes', [[3], [-1]])
+def test_decode_should_raise_on_invalid_codes(colors, codes):
+    with pytest.raises(ValueError):
+        colors.decode(codes)
+
+
+def test_hash_should_be_precomputed(http_statuses):
+    assert http_statuses.OK._hash_ == hash(200)
+    assert hash(http_statuses.OK) == hash(200)
+
+
+def test_hash_of_unhashable_values_should_raise():
+    from choicesenum import ChoicesEnum
+
+    class Coords(ChoicesEnum):
+        ORIGIN = [0, 0]
+
+    with pytest.raises(TypeError):
+        hash(Coords.ORIGIN)
+
+
+def test_items_of_other_enums_should_be_compared_by_value(http_statuses):
+    from choicesenum import ChoicesEnum
+
+    class Codes(ChoicesEnum):
+        SUCCESS = 200
+        CREATED = 201
+
+    assert http_statuses.OK == Codes.SUCCESS
+    assert http_statuses.OK != Codes.CREATED
+    assert http_statuses.OK < Codes.CREATED
+    assert http_statuses.BAD_REQUEST >= Codes.CREATED
+
+
+def test_dynamic_is_attr_should_be_stored_in_the_class_on_first_use():
+    from choicesenum import ChoicesEnum
+
+    class Answer(ChoicesEnum):
+        YES = 'y'
+        NO = 'n'
+
+    assert not any(name.startswith('is_') for name in vars(Answer))
+    assert Answer.YES.is_yes and not Answer.NO.is_yes
+    assert Answer.YES.is_yes and not Answer.NO.is_yes
+    assert [name for name in vars(Answer) if name.startswith('is_')] == ['is_yes']
+
+
+def test_dynamic_is_attr_should_support_aliases():
+    from choicesenum import ChoicesEnum
+
+    class Answer(ChoicesEnum):
+        YES = 'y'
+        SURE = 'y'
+        NO = 'n'
+
+    assert Answer.YES.is_sure
+    assert Answer.SURE.is_yes
+    assert not Answer.NO.is_sure
+
+
+def test_custom_properties_should_take_precedence_over_dynamic_is_attr():
+    from choicesenum import ChoicesEnum
+
+    class Level(ChoicesEnum):
+        LOW = 1
+        HIGH = 2
+        ERROR = 3
+
+        @property
+        def is_error(self):
+            return self >= Level.HIGH
+
+    assert Level.HIGH.is_error
+    assert Level.LOW.is_low
+
+
+@pytest.mark.parametrize('rows', [
+    {'RED': '#f00', 'GREEN': '#0f0'},
+    [('RED', '#f00'), ('GREEN', '#0f0')],
+    [('RED', '#f00', 'Vermelho'), ('GREEN', '#0f0', None)],
+])
+def test_from_table_should_build_enums_from_rows(rows):
+    from choicesenum import ChoicesEnum
+
+    Color = ChoicesEnum.from_table('Color', rows)
+
+    assert issubclass(Color, ChoicesEnum)
+    assert Color.__module__ == __name__
+    assert Color.values() == ('#f00', '#0f0')
+    assert Color('#f00').is_red
+    assert Color.GREEN.display == 'Green'
+
+
+def test_from_table_should_keep_labels_and_base_class_methods():
+    from choicesenum import ChoicesEnum
+
+    class Base(ChoicesEnum):
+        @property
+        def is_primary(self):
+            return self.value.count('f') == 1
+
+    Color = Base.from_table('Color', [('RED', '#f00', 'Vermelho'), ('WHITE', '#fff')])
+
+    assert Color.RED.display == 'Vermelho'
+    assert Color.RED.is_primary
+    assert not Color.WHITE.is_primary
+
+
+def test_dynamic_is_attr_table_should_be_built_on_first_use():
+    from choicesenum import ChoicesEnum
+
+    Color = ChoicesEnum.from_table('Color', [('RED', '#f00')])
+    assert Color._predicates_ is None
+
+    assert Color.RED.is_red
+    assert Color._predicates_ == {'is_red': Color.RED}
@@ -1,10 +1,13 @@
 # coding: utf-8
 from __future__ import absolute_import, unicode_literals
 
+import sys
+
 import mock
 
 import pytest
 import django
+import six
 
 from choicesenum.django.fields import FieldErrors
 
@@ -135,6 +138,35 @@ def test_should_allow_enum_as_a_path_to_class(field_cls, enum_for_field_cls):
     assert field.enum is enum_for_field_cls
 
 
+def test_should_resolve_enum_paths_on_first_use(field_cls, enum_for_field_cls):
+    from choicesenum.django.fields import LazyChoices
+    module = enum_for_field_cls.__module__
+
+    with mock.patch.dict('sys.modules'):
+        del sys.modules[module]
+        field = field_cls(enum=enum_for_field_cls._import_path())
+
+        assert module not in sys.modules
+        assert isinstance(field.choices, LazyChoices)
+        assert field.choices or []  # as in `Field.__init__` of Django < 3.0
+        assert 'enum' not in vars(field)
+
+        assert list(field.choices) == list(field.enum.choices())
+        assert field.enum is enum_for_field_cls
+        assert module not in sys.modules  # already defined, resolved by the registry
+
+
+@pytest.mark.django_db
+def test_should_allow_circular_imports_with_enum_paths():
+    from tests.app.lazy_enums import Shade
+    from tests.app.models import Palette
+    palette = Palette.objects.create(shade=Shade.DARK)
+
+    assert Palette._meta.get_field('shade').enum is Shade
+    assert Palette.objects.get().shade is Shade.DARK
+    assert list(Shade.DARK.palettes()) == [palette]
+
+
 @pytest.mark.skipif(django.VERSION[:2] < (1, 7), reason="requires Django 1.7+ for migrations")
 def test_migrations_deconstruct_support(field_cls, enum_for_field_cls):
     default_enum = enum_for_field_cls.options()[0]
@@ -153,6 +185,15 @@ def test_migrations_deconstruct_support(field_cls, enum_for_field_cls):
     )
 
 
+@pytest.mark.skipif(django.VERSION[:2] < (1, 7), reason="requires Django 1.7+ for migrations")
+def test_migrations_deconstruct_support_with_lazy_coercion(field_cls, enum_for_field_cls):
+    field = field_cls(enum=enum_for_field_cls, lazy_coercion=True)
+    name, path, args, kwargs = field.deconstruct()
+
+    assert kwargs['lazy_coercion'] is True
+    assert field_cls(**kwargs).lazy_coercion is True
+
+
 @pytest.mark.skipif(django.VERSION[:2] < (1, 7), reason="requires Django 1.7+ for migrations")
 def test_migrations_deconstruct_support_without_enum(field_cls, enum_for_field_cls):
     field = field_cls(
@@ -163,7 +204,7 @@ def test_migrations_deconstruct_support_without_enum(field_cls, enum_for_field_c
         'choicesenum.django.fields.{}'.format(field_cls.__name__),
         [],
         {
-            'choices': enum_for_field_cls.choices(),
+            'choices': list(enum_for_field_cls.choices()),
         },
     )
 
@@ -203,6 +244,42 @@ class TestFieldChecks(object):
         # then
         assert [e.id for e in errors] == expected_errors
 
+    def test_should_memoize_results_per_enum_and_value(self, user_statuses):
+        from choicesenum.django.fields import EnumIntegerField
+        fields = [EnumIntegerField(enum=user_statuses, null=True, default=2) for _ in range(3)]
+
+        with mock.patch.object(
+                user_statuses, '_get_member', wraps=user_statuses._get_member) as get_member:
+            for field in fields:
+                assert field.check() == []
+
+        assert get_member.call_count <= 2
+
+    def test_should_accept_unhashable_defaults(self, user_statuses):
+        from choicesenum.django.fields import EnumIntegerField
+        field = EnumIntegerField(enum=user_statuses, default=[2])
+
+        assert [e.id for e in field.check()] == [FieldErrors.E02]
+
+    def test_should_log_the_time_spent(self, user_statuses, caplog):
+        import logging
+        from choicesenum.django.fields import EnumIntegerField
+        field = EnumIntegerField(enum=user_statuses, null=True)
+
+        with caplog.at_level(logging.DEBUG, logger='choicesenum.django.fields'):
+            field.check()
+
+        assert caplog.records[0].getMessage().startswith('Checked <choicesenum.django.fields')
+
+    def test_should_not_swallow_base_exceptions(self, user_statuses):
+        from django.db import models
+        from choicesenum.django.fields import EnumIntegerField
+        field = EnumIntegerField(enum=user_statuses, null=True)
+
+        with mock.patch.object(models.IntegerField, 'check', side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                field.check()
+
 
 class TestCompatModule(object):
 
@@ -216,12 +293,38 @@ class TestCompatModule(object):
             instance = User()
 
             # when
-            instance.status = UserStatus.ACTIVE
+            instance.status = UserStatus.ACTIVE.value
 
             # then
-            m.assert_called_with(UserStatus.ACTIVE)
+            m.assert_called_with(UserStatus.ACTIVE.value)
             assert instance.status == UserStatus.DELETED
 
+    def test_creator_should_store_enum_members_without_conversion(self):
+        from tests.app.models import User, UserStatus
+
+        with mock.patch('choicesenum.django.fields.EnumFieldMixin.to_python') as m:
+            instance = User(status=UserStatus.ACTIVE)
+            instance.status = UserStatus.INACTIVE
+
+        assert not m.called
+        assert instance.status is UserStatus.INACTIVE
+
+    def test_lazy_creator_should_convert_values_on_first_read(self):
+        from choicesenum.django.compat import LazyCreator
+        from choicesenum.django.fields import EnumIntegerField
+        from tests.app.models import User, UserStatus
+
+        field = EnumIntegerField(enum=UserStatus, lazy_coercion=True)
+        field.set_attributes_from_name('status')
+        creator = LazyCreator(field, User)
+        instance = User()
+
+        creator.__set__(instance, '2')
+        assert instance.__dict__['status'] == '2'
+
+        assert creator.__get__(instance, User) is UserStatus.ACTIVE
+        assert instance.__dict__['status'] is UserStatus.ACTIVE
+
 
 @pytest.mark.django_db
 def test_integer_field_should_allow_filters():
@@ -313,3 +416,674 @@ def test_converts_list_aggregations():
     objs = ColorModel.color.field.from_db_value(db_return_value, None, None, None)
 
     assert objs == [Color.RED, Color.GREEN]
+
+
+class TestLazyDisplay(object):
+
+    @pytest.fixture
+    def answers(self):
+        from django.utils.translation import gettext_lazy
+        from choicesenum import ChoicesEnum
+
+        class Answer(ChoicesEnum):
+            YES = 'y', gettext_lazy('Yes')
+            NO = 'n'
+
+        return Answer
+
+    def test_should_resolve_and_cache_lazy_labels_per_language(self, answers):
+        from django.utils import translation
+
+        with translation.override('pt-br'):
+            assert answers.YES.display == 'Sim'
+        with translation.override('en'):
+            assert answers.YES.display == 'Yes'
+
+        assert answers.YES._display_cache_[1] == {'pt-br': 'Sim', 'en': 'Yes'}
+
+    def test_choices_should_keep_lazy_labels(self, answers):
+        from django.utils import translation
+        from django.utils.functional import Promise
+
+        choices = dict(answers.choices())
+
+        assert isinstance(choices[answers.YES], Promise)
+        with translation.override('pt-br'):
+            assert six.text_type(choices[answers.YES]) == 'Sim'
+
+    def test_cache_should_be_cleared_when_translation_settings_change(self, answers):
+        from django.test import override_settings
+        from django.utils import translation
+
+        with translation.override('pt-br'):
+            assert answers.YES.display == 'Sim'
+            answers.YES._display_cache_[1]['pt-br'] = 'stale'
+            assert answers.YES.display == 'stale'
+
+        with override_settings(LOCALE_PATHS=[]), translation.override('pt-br'):
+            assert answers.YES.display == 'Sim'
+
+
+def test_from_db_value_should_not_raise_for_nulls():
+    from tests.app.models import ColorModel
+
+    field = ColorModel._meta.get_field('color')
+    with mock.patch('choicesenum.enums.EnumMeta.__call__') as m:
+        assert field.from_db_value(None, None, None) is None
+        assert field.from_db_value('#f00', None, None).is_red
+    assert not m.called
+
+
+def test_from_db_array_should_keep_falsy_items_and_drop_nulls(string_field_cls, sizes):
+    field = string_field_cls(enum=sizes, null=True)
+
+    result = field.from_db_value(['', None, 'S'], None, None)
+
+    assert result == [sizes.NOT_INFORMED, sizes.EMPTY, sizes.SMALL]
+
+
+def test_from_db_array_should_raise_on_invalid_values():
+    from tests.app.models import ColorModel
+
+    with pytest.raises(ValueError):
+        ColorModel.color.field.from_db_array(['#f00', 'invalid'])
+
+
+class TestGetPrepValue(object):
+
+    @pytest.fixture
+    def field(self):
+        from tests.app.models import User
+        return User._meta.get_field('status')
+
+    def test_should_return_the_value_of_members_and_raw_values(self, field, user_statuses):
+        assert field.get_prep_value(user_statuses.ACTIVE) == 2
+        assert field.get_prep_value(2) == 2
+        assert field.get_prep_value(None) is None
+
+    def test_should_convert_values_through_the_parent_field(self, field):
+        assert field.get_prep_value('2') == 2
+
+    def test_should_raise_for_invalid_values(self, field):
+        with pytest.raises(ValueError):
+            field.get_prep_value(5)
+
+    def test_should_prepare_lists_in_a_single_batch(self, field, user_statuses):
+        from django.db.models import F
+        expression = F('id')
+
+        values = field.get_prep_values([user_statuses.ACTIVE, 3, '4', expression])
+
+        assert values == [2, 3, 4, expression]
+
+        with pytest.raises(ValueError):
+            field.get_prep_values([2, 5])
+
+    @pytest.mark.django_db
+    def test_in_lookup_should_accept_members_and_values(self, user_statuses):
+        from tests.app.models import User
+        User.objects.create(status=user_statuses.ACTIVE)
+        User.objects.create(status=user_statuses.INACTIVE)
+        User.objects.create(status=user_statuses.DELETED)
+
+        statuses = User.objects.filter(
+            status__in=[user_statuses.ACTIVE, 3, '1'],
+        ).values_list('status', flat=True)
+
+        assert sorted(statuses) == [user_statuses.ACTIVE, user_statuses.INACTIVE]
+
+    @pytest.mark.skipif(django.VERSION[:2] < (2, 2), reason="requires Django 2.2+ bulk_update")
+    @pytest.mark.django_db
+    def test_bulk_update_should_store_values(self, user_statuses):
+        from tests.app.models import User
+        users = [User.objects.create(status=user_statuses.PENDING) for _ in range(3)]
+        for user, status in zip(users, [user_statuses.ACTIVE, 3, user_statuses.DELETED]):
+            user.status = status
+
+        User.objects.bulk_update(users, ['status'])
+
+        statuses = User.objects.order_by('pk').values_list('status', flat=True)
+        assert list(statuses) == [
+            user_statuses.ACTIVE, user_statuses.INACTIVE, user_statuses.DELETED]
+
+
+@pytest.mark.django_db
+class TestEnumLookups(object):
+
+    @pytest.fixture
+    def users(self, user_statuses):
+        from tests.app.models import User
+        return [
+            User.objects.create(username=status.name.lower(), status=status)
+            for status in user_statuses
+        ]
+
+    def usernames(self, **filters):
+        from tests.app.models import User
+        return sorted(User.objects.filter(**filters).values_list('username', flat=True))
+
+    def test_is_should_filter_by_item_or_value(self, users, user_statuses):
+        assert self.usernames(status__is=user_statuses.ACTIVE) == ['active']
+        assert self.usernames(status__is=3) == ['inactive']
+
+    def test_is_should_match_nulls_for_the_none_item(self, users, user_statuses):
+        assert self.usernames(status__is=user_statuses.UNDEFINED) == ['undefined']
+        assert self.usernames(status__is=None) == ['undefined']
+
+    def test_in_set_should_accept_enum_sets(self, users, user_statuses):
+        from choicesenum import ChoicesEnumSet
+        items = ChoicesEnumSet(user_statuses, [user_statuses.ACTIVE, user_statuses.DELETED])
+
+        assert self.usernames(status__in_set=items) == ['active', 'deleted']
+
+    def test_in_set_should_match_nulls_for_the_none_item(self, users, user_statuses):
+        assert self.usernames(status__in_set=[None, 1]) == ['pending', 'undefined']
+        assert self.usernames(status__in_set=[user_statuses.UNDEFINED]) == ['undefined']
+        assert self.usernames(status__in_set=[]) == []
+
+    def test_display_expression_should_annotate_labels(self, users, user_statuses):
+        from choicesenum.django.expressions import EnumDisplay
+        from tests.app.models import User
+
+        labels = User.objects.annotate(
+            label=EnumDisplay('status', user_statuses),
+        ).order_by('label').values_list('label', flat=True)
+
+        assert list(labels) == sorted(x.display for x in user_statuses)
+        assert User.objects.annotate(
+            label=EnumDisplay('status', user_statuses),
+        ).filter(label='Active').get().status == user_statuses.ACTIVE
+
+
+class TestEnumOrdinalField(object):
+
+    @pytest.fixture
+    def field(self):
+        from tests.app.models import Palette
+        return Palette._meta.get_field('color_code')
+
+    @pytest.fixture
+    def status_field(self):
+        from tests.app.models import Palette
+        return Palette._meta.get_field('status')
+
+    def test_should_store_ordinals_by_default(self, field, colors):
+        assert [field.get_prep_value(x) for x in colors] == [0, 1, 2]
+        assert field.get_prep_value(colors.BLUE.value) == 2
+        assert field.from_db_value(1, None, None) is colors.GREEN
+
+    def test_should_store_explicit_codes_and_the_none_item_as_null(
+            self, status_field, user_statuses):
+        assert status_field.get_prep_value(user_statuses.ACTIVE) == 20
+        assert status_field.get_prep_value(None) is None
+        assert status_field.from_db_value(40, None, None) is user_statuses.DELETED
+        assert status_field.from_db_value(None, None, None) is user_statuses.UNDEFINED
+
+    def test_should_raise_for_invalid_codes(self, field):
+        with pytest.raises(ValueError) as excinfo:
+            field.from_db_value(7, None, None)
+
+        assert str(excinfo.value) == '7 is not a valid code for Color'
+
+    def test_to_python_should_accept_values_as_text(self, status_field, user_statuses):
+        assert status_field.to_python('2') is user_statuses.ACTIVE
+        with pytest.raises(ValueError):
+            status_field.to_python('5')
+
+    def test_should_validate_items_with_database_integer_ranges(
+            self, field, status_field, colors, user_statuses):
+        from django.core.exceptions import ValidationError
+        from django.core.validators import MaxValueValidator
+        from django.db import connection
+
+        ranges = mock.patch.object(
+            connection.ops, 'integer_field_range', return_value=(0, 32767))
+        with ranges:
+            field, status_field = field.clone(), status_field.clone()
+            status_field.validators.append(MaxValueValidator(user_statuses.ACTIVE))
+
+            assert field.clean('#00f', None) is colors.BLUE
+            assert status_field.clean(2, None) is user_statuses.ACTIVE
+            with pytest.raises(ValidationError):
+                status_field.clean(3, None)
+
+    def test_migrations_deconstruct_support(self, status_field, user_statuses):
+        from choicesenum.django.fields import EnumOrdinalField
+
+        name, path, args, kwargs = status_field.deconstruct()
+        new_field = EnumOrdinalField(*args, **kwargs)
+
+        assert kwargs['codes'] == {1: 10, 2: 20, 3: 30, 4: 40}
+        assert new_field.get_prep_value(user_statuses.INACTIVE) == 30
+        assert new_field.check() == []
+
+    @pytest.mark.parametrize('codes', [
+        {'#f00': 1, '#0f0': 2},
+        {'#f00': 1, '#0f0': 2, '#00f': 2},
+        {'#f00': 1, '#0f0': 2, '#00f': -1},
+        {'#f00': 1, '#0f0': 2, '#00f': 3, '#fff': 4},
+    ], ids=['missing', 'duplicated', 'negative', 'unknown'])
+    def test_check_should_report_invalid_codes(self, colors, codes):
+        from choicesenum.django.fields import EnumOrdinalField
+        field = EnumOrdinalField(enum=colors, codes=codes, default=colors.RED)
+
+        assert [e.id for e in field.check()] == [FieldErrors.E03]
+
+    @pytest.mark.django_db
+    def test_should_filter_and_load_items(self, colors, user_statuses):
+        from tests.app.models import Palette
+        Palette.objects.create(color_code=colors.GREEN, status=user_statuses.ACTIVE)
+        Palette.objects.create(color_code=colors.BLUE)
+
+        assert Palette.objects.get(color_code=colors.GREEN).status is user_statuses.ACTIVE
+        assert Palette.objects.get(status__is=None).color_code is colors.BLUE
+        assert list(Palette.objects.filter(
+            color_code__in=[colors.BLUE.value, colors.RED],
+        ).values_list('color_code', flat=True)) == [colors.BLUE]
+
+    @pytest.mark.django_db
+    def test_copy_operation_should_copy_items_both_ways(self, colors):
+        from django.db import connection
+        from django.db.migrations.state import ProjectState
+        from choicesenum.django.operations import CopyEnumField
+        from tests.app.models import Palette
+        Palette.objects.create(color=colors.GREEN, color_code=colors.RED)
+        Palette.objects.create(color=colors.BLUE, color_code=colors.RED)
+        state = ProjectState.from_apps(django.apps.apps)
+        operation = CopyEnumField('palette', 'color', 'color_code')
+        editor = mock.Mock(connection=connection)
+
+        operation.database_forwards('app', editor, state, state)
+
+        assert list(Palette.objects.order_by('pk').values_list('color_code', flat=True)) == [
+            colors.GREEN, colors.BLUE]
+
+        Palette.objects.update(color=colors.RED)
+        operation.database_backwards('app', editor, state, state)
+
+        assert list(Palette.objects.order_by('pk').values_list('color', flat=True)) == [
+            colors.GREEN, colors.BLUE]
+        assert operation.deconstruct() == (
+            'CopyEnumField', ('palette', 'color', 'color_code'), {})
+
+
+class TestEnumNativeField(object):
+
+    @pytest.fixture
+    def field(self):
+        from tests.app.models import Palette
+        return Palette._meta.get_field('size')
+
+    @pytest.fixture
+    def postgres(self):
+        connection = mock.MagicMock(vendor='postgresql')
+        connection.ops.quote_name.side_effect = lambda name: '"{}"'.format(name)
+        return connection
+
+    def test_should_use_the_enum_type_on_postgres(self, field, postgres):
+        from django.db import connection
+
+        assert field.db_type(postgres) == '"sizes"'
+        assert field.db_type(connection) == 'varchar(1)'
+
+    def test_type_values_should_skip_none(self, field):
+        assert field.type_values() == ['', 'S', 'M', 'L']
+
+    def test_migrations_deconstruct_support(self, field, sizes):
+        from choicesenum.django.fields import EnumNativeField
+
+        name, path, args, kwargs = field.deconstruct()
+
+        assert kwargs['type_name'] == 'sizes'
+        assert kwargs['type_values'] == ['', 'S', 'M', 'L']
+        assert kwargs['enum'] is sizes
+        assert EnumNativeField(*args, **kwargs).type_name == 'sizes'
+
+    def test_historical_fields_should_keep_the_values_of_their_migration(self, sizes):
+        from choicesenum.django.fields import EnumNativeField
+
+        field = EnumNativeField(enum=sizes, type_values=['S', 'M'])
+
+        assert field.type_values() == ['S', 'M']
+        assert field.deconstruct()[3]['type_values'] == ['S', 'M']
+
+    def test_makemigrations_should_detect_new_type_values(self):
+        from django.apps.registry import Apps
+        from django.db import models
+        from django.db.migrations.autodetector import MigrationAutodetector
+        from django.db.migrations.operations import AlterField
+        from django.db.migrations.state import ModelState, ProjectState
+        from choicesenum import ChoicesEnum
+        from choicesenum.django.fields import EnumNativeField
+
+        def state(*values):
+            enum = ChoicesEnum('Size', [(value, value) for value in values])
+            model = type(str('Shirt'), (models.Model, ), {
+                '__module__': __name__,
+                'Meta': type(str('Meta'), (), {'app_label': 'app', 'apps': Apps()}),
+                'size': EnumNativeField(enum=enum, type_name='size', max_length=1),
+            })
+            state = ProjectState()
+            state.add_model(ModelState.from_model(model))
+            return state
+
+        changes = MigrationAutodetector(state('S', 'M'), state('S', 'M', 'L'))._detect_changes()
+
+        operations = [op for migration in changes['app'] for op in migration.operations]
+        assert [type(op) for op in operations] == [AlterField]
+        assert operations[0].field.type_values() == ['S', 'M', 'L']
+
+    @pytest.fixture
+    def migrations(self):
+        from django.db.migrations.migration import Migration
+        from choicesenum.django.operations import AddEnumValues, CreateEnumType
+        first, second = Migration('0001_initial', 'app'), Migration('0002_sizes', 'app')
+        first.operations = [CreateEnumType('sizes', ['', 'S'])]
+        second.operations = [AddEnumValues('sizes', ['M'])]
+        loader = mock.Mock(
+            migrated_apps={'app'},
+            disk_migrations={('app', '0001_initial'): first, ('app', '0002_sizes'): second})
+        with mock.patch('django.db.migrations.loader.MigrationLoader', return_value=loader):
+            yield loader
+
+    def check_types(self):
+        from django.apps import apps
+        from choicesenum.django.fields import _check_enum_types
+        return _check_enum_types([apps.get_app_config('app')])
+
+    def test_check_should_report_type_values_missing_from_migrations(self, migrations):
+        warnings = self.check_types()
+
+        assert [(w.id, w.obj.name) for w in warnings] == [(FieldErrors.W01, 'size')]
+        assert warnings[0].hint == "Add `AddEnumValues('sizes', ['L'])` to a migration, " \
+            "before the one using them."
+
+    def test_check_should_report_types_missing_from_migrations(self, migrations):
+        migrations.disk_migrations = {}
+
+        assert "CreateEnumType('sizes', ['', 'S', 'M', 'L'])" in self.check_types()[0].hint
+
+    def test_check_should_accept_types_created_by_migrations(self, migrations):
+        from choicesenum.django.operations import AddEnumValues
+        migrations.disk_migrations[('app', '0002_sizes')].operations.append(
+            AddEnumValues('sizes', ['L']))
+
+        assert self.check_types() == []
+
+    def test_check_should_skip_apps_without_migrations(self, migrations):
+        migrations.migrated_apps = set()
+
+        assert self.check_types() == []
+
+    def test_check_should_report_non_text_values(self, user_statuses):
+        from choicesenum.django.fields import EnumNativeField
+        field = EnumNativeField(enum=user_statuses, null=True)
+
+        assert field.type_name == 'user_status'
+        assert [e.id for e in field.check()] == [FieldErrors.E04]
+
+    def test_operations_should_run_only_on_postgres(self, postgres):
+        from django.db import connection
+        from choicesenum.django.operations import AddEnumValues, CreateEnumType
+        editor = mock.Mock(connection=postgres)
+        create, add = CreateEnumType('sizes', ['S', 'M']), AddEnumValues('sizes', ['L'])
+
+        for operation in (create, add):
+            operation.database_forwards('app', editor, None, None)
+            operation.database_forwards('app', mock.Mock(connection=connection), None, None)
+        add.database_backwards('app', editor, None, None)
+        create.database_backwards('app', editor, None, None)  # the type may be shared
+
+        assert [c[0] for c in editor.execute.call_args_list] == [
+            ('DO $$ BEGIN CREATE TYPE "sizes" AS ENUM (%s, %s); '
+             'EXCEPTION WHEN duplicate_object THEN NULL; END $$', ['S', 'M']),
+            ('ALTER TYPE "sizes" ADD VALUE IF NOT EXISTS %s', ['L']),
+        ]
+
+    def test_migrations_should_emit_the_type_statements(self, postgres):
+        from django.db.migrations.migration import Migration
+        from django.db.migrations.state import ProjectState
+        from choicesenum.django.operations import AddEnumValues, CreateEnumType
+        migration = Migration('0002_sizes', 'app')
+        migration.operations = [CreateEnumType('sizes', ['S']), AddEnumValues('sizes', ['M'])]
+        editor = mock.Mock(connection=postgres)
+
+        migration.apply(ProjectState(), editor, collect_sql=True)  # eg. sqlmigrate
+
+        assert [c[0][0].split(' AS ')[0] for c in editor.execute.call_args_list] == [
+            'DO $$ BEGIN CREATE TYPE "sizes"',
+            'ALTER TYPE "sizes" ADD VALUE IF NOT EXISTS %s',
+        ]
+
+    @pytest.mark.django_db
+    def test_should_fall_back_to_varchar(self, sizes):
+        from tests.app.models import Palette
+        Palette.objects.create(size=sizes.MEDIUM)
+
+        assert Palette.objects.get(size__in_set=[sizes.MEDIUM, None]).size is sizes.MEDIUM
+
+
+class TestCheckConstraint(object):
+
+    def constraints(self, model):
+        return dict((c.name, c) for c in model._meta.constraints)
+
+    def test_should_add_a_constraint_with_the_enum_values(self, colors):
+        from django.db.models import CheckConstraint, Q
+        from tests.app.models import Palette
+
+        constraints = self.constraints(Palette)
+
+        assert constraints['app_palette_color_enum'] == CheckConstraint(
+            check=Q(color__in=['#f00', '#0f0', '#00f']), name='app_palette_color_enum')
+        assert constraints['app_palette_status_enum'] == CheckConstraint(
+            check=Q(status__in=[1, 2, 3, 4]) | Q(status__isnull=True),
+            name='app_palette_status_enum')
+
+    def test_should_skip_abstract_models(self):
+        from tests.app.models import AbstractTagged, Tag
+
+        assert AbstractTagged._meta.constraints == []
+        assert list(self.constraints(Tag)) == ['app_tag_color_enum']
+
+    def state(self, enum):
+        from django.apps.registry import Apps
+        from django.db import models
+        from django.db.migrations.state import ModelState, ProjectState
+        from choicesenum.django.fields import EnumCharField
+
+        class Meta:
+            app_label = 'app'
+            apps = Apps()
+
+        model = type(str('Item'), (models.Model, ), {
+            '__module__': __name__,
+            'Meta': Meta,
+            'color': EnumCharField(max_length=7, enum=enum, check_constraint=True),
+        })
+        state = ProjectState()
+        state.add_model(ModelState.from_model(model))
+        return state
+
+    def operations(self, from_state, to_state):
+        from django.db.migrations.autodetector import MigrationAutodetector
+        from django.db.migrations.graph import MigrationGraph
+        from django.db.migrations.questioner import MigrationQuestioner
+
+        questioner = MigrationQuestioner(specified_apps=['app'])
+        changes = MigrationAutodetector(from_state, to_state, questioner).changes(
+            graph=MigrationGraph())
+        return [
+            operation for migration in changes.get('app', [])
+            for operation in migration.operations
+        ]
+
+    @pytest.fixture
+    def enums(self):
+        from choicesenum import ChoicesEnum
+
+        class Color(ChoicesEnum):
+            RED = '#f00'
+            GREEN = '#0f0'
+
+        class NewColor(ChoicesEnum):
+            RED = '#f00'
+            GREEN = '#0f0'
+            BLUE = '#00f'
+
+        return Color, NewColor
+
+    def test_makemigrations_should_add_the_constraint(self, enums):
+        from django.db.migrations.operations import AddConstraint
+        from django.db.migrations.state import ProjectState
+
+        operations = self.operations(ProjectState(), self.state(enums[0]))
+
+        added = [op for op in operations if isinstance(op, AddConstraint)]
+        assert [op.constraint.name for op in added] == ['app_item_color_enum']
+        assert added[0].constraint.check.children == [('color__in', ['#f00', '#0f0'])]
+
+    def test_makemigrations_should_update_the_constraint_with_the_enum(self, enums):
+        from django.db.migrations.operations import AddConstraint, RemoveConstraint
+
+        old_state, new_state = self.state(enums[0]), self.state(enums[1])
+
+        assert self.operations(old_state, self.state(enums[0])) == []
+        operations = self.operations(old_state, new_state)
+        assert [op.name for op in operations if isinstance(op, RemoveConstraint)] == [
+            'app_item_color_enum']
+        added = [op.constraint for op in operations if isinstance(op, AddConstraint)]
+        assert added[0].check.children == [('color__in', ['#f00', '#0f0', '#00f'])]
+
+    def test_historical_models_should_keep_the_constraint_of_their_state(self, enums):
+        old_state = self.state(enums[0])
+        self.state(enums[1])
+
+        model = old_state.apps.get_model('app', 'Item')
+
+        assert [c.name for c in model._meta.constraints] == ['app_item_color_enum']
+        assert model._meta.constraints[0].check.children == [
+            ('color__in', ['#f00', '#0f0'])]
+
+    def test_temporary_tables_should_not_get_constraints(self, enums):
+        from django.db import models
+
+        model = self.state(enums[0]).apps.get_model('app', 'Item')
+        body = dict(
+            (field.name, field.clone()) for field in model._meta.local_fields)
+        body.update(__module__=model.__module__, Meta=type(str('Meta'), (), {
+            'app_label': 'app', 'db_table': 'new__app_item', 'apps': model._meta.apps,
+            'constraints': list(model._meta.constraints)}))
+
+        temporary = type(str('NewItem'), (models.Model, ), body)  # see sqlite `_remake_table`
+
+        assert [c.name for c in temporary._meta.constraints] == ['app_item_color_enum']
+
+    def test_migrations_deconstruct_support(self):
+        from tests.app.models import Palette
+
+        name, path, args, kwargs = Palette._meta.get_field('color').deconstruct()
+
+        assert kwargs['check_constraint'] is True
+
+    @pytest.mark.django_db
+    def test_should_reject_invalid_values_on_write(self):
+        from django.db import IntegrityError, connection, transaction
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "insert into app_palette (color, color_code, status, size, shade) "
+                    "values ('#fff', 0, 10, 'S', 'dark')")
+
+    @pytest.mark.django_db
+    def test_should_translate_values_of_ordinal_fields_to_codes(self):
+        from django.db import IntegrityError, connection, transaction
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "insert into app_palette (color, color_code, status, size, shade) "
+                    "values ('#f00', 0, 1, 'S', 'dark')")
+
+
+class TestEnumSetField(object):
+
+    @pytest.fixture
+    def field(self):
+        from tests.app.models import Swatch
+        return Swatch._meta.get_field('colors')
+
+    def test_should_convert_items_values_and_masks_to_sets(self, field, colors):
+        from choicesenum import ChoicesEnumSet
+
+        assert field.to_python([colors.RED, '#00f']) == ChoicesEnumSet(colors, [
+            colors.RED, colors.BLUE])
+        assert field.to_python(6) == ChoicesEnumSet(colors, [colors.GREEN, colors.BLUE])
+        assert field.to_python('1') == ChoicesEnumSet(colors, [colors.RED])
+        assert field.to_python(None) is None
+
+    def test_should_store_masks(self, field, colors):
+        assert field.get_prep_value([colors.BLUE, colors.RED]) == 5
+        assert field.get_prep_value(None) is None
+        assert field.from_db_value(3, None, None) == {colors.RED, colors.GREEN}
+        assert field.from_db_value(None, None, None) is None
+
+    def test_should_validate_sets_with_database_integer_ranges(self, field, colors):
+        from django.db import connection
+
+        ranges = mock.patch.object(
+            connection.ops, 'integer_field_range', return_value=(-2 ** 63, 2 ** 63 - 1))
+        with ranges:
+            field = field.clone()
+
+            assert field.clean([colors.RED], None) == {colors.RED}
+
+    def test_should_default_to_an_empty_set(self, colors):
+        from tests.app.models import Swatch
+
+        first, second = Swatch(), Swatch()
+        first.colors.add(colors.RED)
+
+        assert first.colors == {colors.RED}
+        assert second.colors == set()
+
+    def test_should_serialize_masks(self, colors):
+        from tests.app.models import Swatch
+        field = Swatch._meta.get_field('colors')
+
+        assert field.value_to_string(Swatch(colors=[colors.GREEN])) == '2'
+
+    def test_migrations_deconstruct_support(self, field, colors):
+        from choicesenum.django.fields import EnumSetField
+
+        name, path, args, kwargs = field.deconstruct()
+
+        assert kwargs == {'enum': colors, 'default': 0}
+        assert EnumSetField(*args, **kwargs).enum is colors
+
+    def test_check_should_report_enums_too_large_for_a_bitmask(self):
+        from choicesenum import ChoicesEnum
+        from choicesenum.django.fields import EnumSetField
+        field = EnumSetField(enum=ChoicesEnum('Big', [('N%d' % i, i) for i in range(64)]))
+
+        assert [e.id for e in field.check()] == [FieldErrors.E05]
+
+    @pytest.mark.django_db
+    def test_lookups_should_filter_with_bitwise_sql(self, colors, sizes):
+        from tests.app.models import Swatch
+        Swatch.objects.create(colors=[colors.RED])
+        Swatch.objects.create(colors=[colors.RED, colors.GREEN], sizes=[sizes.SMALL])
+        Swatch.objects.create(colors=[colors.BLUE])
+
+        def count(**filters):
+            return Swatch.objects.filter(**filters).count()
+
+        assert count(colors__has=colors.RED) == 2
+        assert count(colors__has='#00f') == 1
+        assert count(colors__has_all=[colors.RED, colors.GREEN]) == 1
+        assert count(colors__has_any=[colors.GREEN, colors.BLUE]) == 2
+        assert count(colors__has_any=[]) == 0
+        assert count(sizes__has=sizes.SMALL) == 1
+        assert count(sizes__isnull=True) == 2
+        assert Swatch.objects.get(colors__has=colors.GREEN).colors == {colors.RED, colors.GREEN}
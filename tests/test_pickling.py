@@ -0,0 +1,85 @@
+# coding: utf-8
+from __future__ import absolute_import, unicode_literals
+
+import pickle
+
+import pytest
+
+from choicesenum import pickling, registry
+
+
+@pytest.fixture
+def compact(colors, user_statuses):
+    enums = (colors, user_statuses)
+    pickling.enable_compact_pickle(*enums)
+    yield enums
+    pickling.disable_compact_pickle(*enums)
+    for enum in enums:
+        registry.remove_id(enum)
+
+
+def test_should_pickle_items_as_enum_id_and_ordinal(compact, colors, user_statuses):
+    data = pickle.dumps([colors.BLUE, user_statuses.ACTIVE, 'other'], protocol=2)
+
+    assert b'_load_member' not in data  # referenced by its extension code
+    assert b'tests.app.enums' not in data
+    assert pickle.loads(data) == [colors.BLUE, user_statuses.ACTIVE, 'other']
+    assert pickle.loads(data)[0] is colors.BLUE
+
+
+@pytest.mark.parametrize('protocol', [2, pickle.HIGHEST_PROTOCOL])
+def test_compact_pickles_should_be_smaller(colors, user_statuses, protocol):
+    payloads = [colors.BLUE, [colors.BLUE, colors.RED, user_statuses.ACTIVE] * 100]
+    default = [len(pickle.dumps(payload, protocol=protocol)) for payload in payloads]
+
+    pickling.enable_compact_pickle(colors, user_statuses)
+    try:
+        compact = [len(pickle.dumps(payload, protocol=protocol)) for payload in payloads]
+    finally:
+        pickling.disable_compact_pickle(colors, user_statuses)
+        for enum in (colors, user_statuses):
+            registry.remove_id(enum)
+
+    assert compact[0] * 2 < default[0]
+    assert compact[1] < default[1]
+
+
+def test_default_ids_should_be_small_sequential_ints(compact, colors, user_statuses):
+    first, second = registry.id_of(colors), registry.id_of(user_statuses)
+
+    assert second == first + 1
+    assert pickling._reduce_member(colors.GREEN)[1] == (first, 1)
+
+
+def test_should_use_explicit_ids(http_statuses):
+    pickling.register(http_statuses, 7)
+    pickling.enable_compact_pickle(http_statuses)
+    try:
+        data = pickle.dumps(http_statuses.FORBIDDEN, protocol=2)
+
+        assert pickle.loads(data) is http_statuses.FORBIDDEN
+        assert pickling._reduce_member(http_statuses.FORBIDDEN)[1] == (7, 3)
+    finally:
+        pickling.disable_compact_pickle(http_statuses)
+        registry.remove_id(http_statuses)
+
+
+def test_should_reject_ids_used_by_other_enums(compact, colors, sizes):
+    with pytest.raises(ValueError):
+        pickling.register(sizes, registry.id_of(colors))
+
+
+def test_should_raise_for_unknown_ids(compact, colors):
+    data = pickle.dumps(colors.RED, protocol=2)
+    registry.remove_id(colors)
+
+    with pytest.raises(pickle.UnpicklingError):
+        pickle.loads(data)
+
+    pickling.register(colors)
+
+
+def test_disable_should_restore_the_default_pickling(compact, colors):
+    pickling.disable_compact_pickle(colors)
+
+    assert b'tests.app.enums' in pickle.dumps(colors.RED, protocol=2)
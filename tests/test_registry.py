@@ -0,0 +1,67 @@
+# coding: utf-8
+from __future__ import absolute_import, unicode_literals
+
+import gc
+
+import pytest
+
+from choicesenum import ChoicesEnum, registry
+
+
+def test_should_register_enums_by_import_path(colors):
+    assert registry.get('tests.app.enums.Color') is colors
+    assert registry.get('tests.app.enums.Unknown') is None
+    assert registry.get('choicesenum.enums.ChoicesEnum') is None  # no items
+
+
+def test_should_replace_enums_redefined_under_the_same_path():
+    class Fruit(ChoicesEnum):
+        APPLE = 'apple'
+
+    class Fruit(ChoicesEnum):  # noqa: F811
+        APPLE = 'apple'
+        PEAR = 'pear'
+
+    assert registry.get(Fruit._import_path()) is Fruit
+
+
+def test_should_not_keep_unreferenced_enums_alive():
+    class Ephemeral(ChoicesEnum):
+        ONE = 1
+
+    path = Ephemeral._import_path()
+    del Ephemeral
+    gc.collect()
+
+    assert registry.get(path) is None
+
+
+def test_resolve_should_import_enums_not_registered(colors):
+    assert registry.resolve('tests.app.enums.Color') is colors
+    assert registry.resolve('tests.app.lazy_enums.Shade').__name__ == 'Shade'
+
+    with pytest.raises(ImportError):
+        registry.resolve('tests.app.enums.Unknown')
+    with pytest.raises(ImportError):
+        registry.resolve('tests.app.missing.Color')
+
+
+def test_should_register_short_ids(colors, sizes):
+    registry.set_id(colors, 'c')
+    try:
+        assert registry.get_by_id('c') is colors
+        assert registry.id_of(colors) == 'c'
+        assert registry.id_of(sizes) is None
+        with pytest.raises(ValueError):
+            registry.set_id(sizes, 'c')
+    finally:
+        registry.remove_id(colors)
+
+    assert registry.get_by_id('c') is None
+
+
+def test_registered_should_list_the_enums_and_their_sizes(colors):
+    entries = registry.registered()
+
+    assert ('tests.app.enums.Color', len(colors)) in entries
+    assert entries == sorted(entries)
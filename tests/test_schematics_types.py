@@ -21,3 +21,49 @@ def test_choices_enum_type_should_throw_exception():
     with pytest.raises(ValidationError) as e:
         ChoicesEnumType(object)
         assert e.value.message[0] == ChoicesEnumType.Messages.INVALID_TYPE
+
+
+def test_choices_enum_type_should_keep_members(http_statuses):
+    state = ChoicesEnumType(http_statuses)
+
+    assert state.to_native(http_statuses.OK) is http_statuses.OK
+    assert state.to_primitive(http_statuses.OK) == 200
+
+
+def test_choices_enum_type_should_raise_value_error_for_invalid_values(http_statuses):
+    state = ChoicesEnumType(http_statuses)
+
+    with pytest.raises(ValueError):
+        state.to_native(999)
+    with pytest.raises(ValueError):
+        state.to_primitive(999)
+
+
+@pytest.fixture
+def request_log(http_statuses):
+    from schematics.models import Model
+    from choicesenum.schematics.types import ChoicesEnumListType
+
+    class RequestLog(Model):
+        statuses = ChoicesEnumListType(http_statuses, max_size=3)
+
+    return RequestLog
+
+
+def test_choices_enum_list_type_should_convert_lists(request_log, http_statuses):
+    log = request_log({'statuses': [200, http_statuses.FORBIDDEN, 401]})
+
+    assert log.statuses == [http_statuses.OK, http_statuses.FORBIDDEN, http_statuses.UNAUTHORIZED]
+    assert all(isinstance(x, http_statuses) for x in log.statuses)
+    assert log.to_primitive() == {'statuses': [200, 403, 401]}
+
+
+def test_choices_enum_list_type_should_validate_items(request_log, http_statuses):
+    from schematics.exceptions import DataError
+
+    with pytest.raises(ValueError):
+        request_log({'statuses': [200, 999]})
+
+    log = request_log({'statuses': [200, 400, 401, 403]})
+    with pytest.raises(DataError):
+        log.validate()
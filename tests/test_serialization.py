@@ -0,0 +1,147 @@
+# coding: utf-8
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+import pytest
+
+from choicesenum import ChoicesEnumSet
+from choicesenum.serialization import ChoicesJSONEncoder, json_default
+
+
+class Point(object):
+
+    def __json__(self):
+        return [1, 2]
+
+
+@pytest.fixture
+def data(colors, user_statuses):
+    return {
+        'color': colors.RED,
+        'statuses': ChoicesEnumSet(user_statuses, [1, 2]),
+        'point': Point(),
+        'plain': [1, 'a'],
+    }
+
+
+EXPECTED = {'color': '#f00', 'statuses': [1, 2], 'point': [1, 2], 'plain': [1, 'a']}
+
+
+def test_json_default_should_convert_items_sets_and_json_objects(data):
+    assert json.loads(json.dumps(data, default=json_default)) == EXPECTED
+
+
+def test_json_default_should_raise_for_other_objects():
+    with pytest.raises(TypeError) as excinfo:
+        json.dumps({'a': object()}, default=json_default)
+
+    assert str(excinfo.value) == 'Object of type object is not JSON serializable'
+
+
+def test_json_default_should_not_keep_classes_it_cant_serialize():
+    from choicesenum.serialization import _json_converters
+
+    with pytest.raises(TypeError):
+        json_default(object())
+
+    assert object not in _json_converters
+
+
+def test_json_default_should_call_the_json_method_of_enums():
+    from choicesenum import ChoicesEnum
+    from choicesenum.patches import patched_json
+
+    class Option(ChoicesEnum):
+        A = 'a', 'Label A'
+
+        def __json__(self):
+            return {'value': self.value, 'label': self.display}
+
+    expected = [{'value': 'a', 'label': 'Label A'}]
+    assert json.loads(json.dumps([Option.A], default=json_default)) == expected
+    with patched_json():
+        assert json.loads(json.dumps([Option.A])) == expected
+
+
+def test_encoder_should_use_json_default(data):
+    assert json.loads(json.dumps(data, cls=ChoicesJSONEncoder)) == EXPECTED
+
+
+def test_json_default_should_work_with_orjson(data):
+    orjson = pytest.importorskip('orjson')
+
+    assert json.loads(orjson.dumps(data, default=json_default)) == EXPECTED
+
+
+def test_patched_json_should_restore_the_encoder(data):
+    from choicesenum.patches import patched_json
+    default = json.JSONEncoder.default
+
+    with patched_json():
+        assert json.loads(json.dumps(data)) == EXPECTED
+
+    assert json.JSONEncoder.default is default
+
+
+def test_patched_json_should_fall_back_to_the_previous_default(data):
+    from choicesenum.patches import patched_json
+    default = json.JSONEncoder.default
+
+    def _default(self, obj):
+        if isinstance(obj, frozenset):
+            return sorted(obj)
+        return default(self, obj)
+
+    json.JSONEncoder.default = _default
+    try:
+        with patched_json():
+            assert json.loads(json.dumps(dict(data, other=frozenset([2, 1])))) == dict(
+                EXPECTED, other=[1, 2])
+            with pytest.raises(TypeError):
+                json.dumps(object())
+    finally:
+        json.JSONEncoder.default = default
+
+
+def test_iter_ndjson_should_encode_one_line_per_record(colors, user_statuses):
+    from choicesenum.serialization import iter_ndjson
+    records = [{'color': colors.RED, 'n': 1}, [user_statuses.ACTIVE], colors.BLUE]
+
+    lines = list(iter_ndjson(records, sort_keys=True))
+
+    assert lines == ['{"color": "#f00", "n": 1}', '[2]', '"#00f"']
+
+
+def test_iter_ndjson_should_add_labels_on_demand(colors):
+    from choicesenum.serialization import iter_ndjson
+    records = [{'color': colors.RED, 'n': 1}, colors.BLUE]
+
+    lines = list(iter_ndjson(records, display=True, sort_keys=True))
+
+    assert lines == ['{"color": "#f00", "color_display": "Vermelho", "n": 1}', '"#00f"']
+
+
+def test_iter_ndjson_should_consume_records_lazily(colors):
+    import itertools
+    from choicesenum.serialization import iter_ndjson
+
+    lines = iter_ndjson({'color': colors.GREEN} for _ in itertools.count())
+
+    assert list(itertools.islice(lines, 2)) == ['{"color": "#0f0"}'] * 2
+
+
+def test_write_ndjson_should_write_in_chunks(colors):
+    import io
+    from choicesenum.serialization import write_ndjson
+    stream = io.StringIO()
+    written = []
+    write = stream.write
+    stream.write = lambda text: written.append(write(text))
+
+    count = write_ndjson(({'color': color} for color in colors), stream, chunk_size=2)
+
+    assert count == 3
+    assert len(written) == 2
+    assert stream.getvalue().splitlines() == [
+        '{"color": "#f00"}', '{"color": "#0f0"}', '{"color": "#00f"}']
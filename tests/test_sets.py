@@ -0,0 +1,108 @@
+# coding: utf-8
+from __future__ import absolute_import, unicode_literals
+
+import json
+import pickle
+
+import pytest
+
+from choicesenum import ChoicesEnumSet
+
+
+@pytest.fixture
+def active_statuses(user_statuses):
+    return ChoicesEnumSet(user_statuses, [user_statuses.PENDING, 2])
+
+
+def test_should_store_items_as_a_bitmask(user_statuses, active_statuses):
+    assert active_statuses.mask == 0b110
+    assert list(active_statuses) == [user_statuses.PENDING, user_statuses.ACTIVE]
+    assert len(active_statuses) == 2
+
+
+def test_membership_should_accept_items_and_values(user_statuses, active_statuses):
+    assert user_statuses.ACTIVE in active_statuses
+    assert 1 in active_statuses
+    assert user_statuses.DELETED not in active_statuses
+    assert 'invalid' not in active_statuses
+    assert ['unhashable'] not in active_statuses
+
+
+def test_should_raise_on_invalid_items(user_statuses):
+    with pytest.raises(ValueError):
+        ChoicesEnumSet(user_statuses, [999])
+
+    with pytest.raises(ValueError):
+        ChoicesEnumSet(user_statuses).add(999)
+
+
+def test_add_and_discard(user_statuses, active_statuses):
+    active_statuses.add(user_statuses.DELETED)
+    active_statuses.discard(1)
+    active_statuses.discard(999)
+
+    assert active_statuses.values() == [2, 4]
+
+
+def test_set_operations(user_statuses, active_statuses):
+    inactive = ChoicesEnumSet(user_statuses, [user_statuses.ACTIVE, user_statuses.INACTIVE])
+
+    assert (active_statuses | inactive).values() == [1, 2, 3]
+    assert (active_statuses & inactive).values() == [2]
+    assert (active_statuses - inactive).values() == [1]
+    assert (active_statuses ^ inactive).values() == [1, 3]
+    assert active_statuses.union([3], [4]).values() == [1, 2, 3, 4]
+    assert active_statuses.intersection([2, 3]).values() == [2]
+    assert active_statuses.difference([2]).values() == [1]
+
+
+def test_set_operations_with_builtin_sets(user_statuses, active_statuses):
+    result = active_statuses | {user_statuses.DELETED}
+    assert isinstance(result, ChoicesEnumSet)
+    assert result.values() == [1, 2, 4]
+
+    result = {user_statuses.ACTIVE} & active_statuses
+    assert result.values() == [2]
+
+
+def test_inplace_operations(user_statuses, active_statuses):
+    active_statuses |= [4]
+    active_statuses -= [1]
+    assert active_statuses.values() == [2, 4]
+
+    active_statuses &= [4]
+    assert active_statuses.values() == [4]
+
+    active_statuses ^= [3, 4]
+    assert active_statuses.values() == [3]
+
+
+def test_comparisons(user_statuses, active_statuses):
+    assert active_statuses == ChoicesEnumSet(user_statuses, [2, 1])
+    assert active_statuses == {user_statuses.PENDING, user_statuses.ACTIVE}
+    assert active_statuses != ChoicesEnumSet(user_statuses, [1])
+    assert ChoicesEnumSet(user_statuses, [1]) <= active_statuses
+    assert active_statuses >= ChoicesEnumSet(user_statuses, [1])
+
+
+def test_from_mask(user_statuses, active_statuses):
+    assert ChoicesEnumSet.from_mask(user_statuses, active_statuses.mask) == active_statuses
+
+    with pytest.raises(ValueError):
+        ChoicesEnumSet.from_mask(user_statuses, 1 << 5)
+
+
+def test_should_be_picklable(active_statuses):
+    assert pickle.loads(pickle.dumps(active_statuses)) == active_statuses
+
+
+def test_should_be_json_serializable(active_statuses):
+    from choicesenum.patches import patch_json
+    patch_json()
+
+    assert json.dumps(active_statuses) == '[1, 2]'
+
+
+def test_repr(active_statuses):
+    assert repr(active_statuses) == \
+        'ChoicesEnumSet(UserStatus, [UserStatus(1).PENDING, UserStatus(2).ACTIVE])'